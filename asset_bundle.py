@@ -0,0 +1,179 @@
+"""Pre-decoded asset bundle.
+
+Run this module to build the bundle after changing any images or sounds:
+
+    python asset_bundle.py
+
+The bundle holds the texture atlas and stand-alone images as raw pixels in
+the display format, plus sound effects as PCM in the mixer format.  At
+startup it is memory-mapped and surfaces are created with image.frombuffer,
+so nothing is decoded.  A bundle older than any of its source files, or
+built for a different display or mixer format, is ignored.
+"""
+from game_images import ATLAS_IMAGES, GameImages
+from game_sounds import SOUND_EFFECTS, SOUND_FOLDER
+import json
+import mmap
+from os import path
+from pygame import display, HIDDEN, image, init, mixer
+from struct import calcsize, pack, unpack_from
+
+BUNDLE = "assets.bundle"
+MAGIC = b"SABOTAGE"
+VERSION = 1
+HEADER = "<8sII"  # Magic, version, index length
+ALIGNMENT = 16  # Byte alignment of each blob
+PIXEL_FORMAT = "BGRA"
+# Stand-alone images not packed into the atlas
+IMAGES = ["images/bunker.png", "images/title.png"]
+
+
+class AssetBundle:
+    """Memory-mapped bundle of pre-decoded images and sounds."""
+
+    def __init__(self, filename=BUNDLE):
+        """Map a bundle file into memory.
+
+        Args:
+            filename(string): Path of the bundle file.
+        """
+        self.filename = filename
+        with open(filename, "rb") as bundle_file:
+            # Private mapping so pixels are paged in on demand, never copied
+            self.data = mmap.mmap(bundle_file.fileno(), 0,
+                                  access=mmap.ACCESS_COPY)
+        magic, version, index_length = unpack_from(HEADER, self.data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Invalid asset bundle.")
+        start = calcsize(HEADER)
+        self.index = json.loads(self.data[start:start + index_length])
+        # Blob offsets are relative to the aligned end of the index
+        self.view = memoryview(self.data)[align(start + index_length):]
+
+    @property
+    def current(self):
+        """Return True if the bundle matches its sources and the display."""
+        bundle_time = path.getmtime(self.filename)
+        if any(not path.exists(source) or
+               path.getmtime(source) > bundle_time
+               for source in self.index["sources"]):
+            return False
+        return list(display.get_surface().get_masks()[:3]) == (
+            self.index["display_masks"])
+
+    def install_images(self):
+        """Install the atlas pages and images into the image registry."""
+        pages = [self.surface(page) for page in self.index["pages"]]
+        regions = {filename: (pages[page], rect) for filename, (page, rect)
+                   in self.index["regions"].items()}
+        GameImages.install(pages, regions)
+        for filename, blob in self.index["images"].items():
+            GameImages.surfaces[filename] = self.surface(blob)
+
+    def sound(self, effect):
+        """Return a sound effect built from PCM, or None if unavailable.
+
+        Args:
+            effect(string): Name of the sound effect.
+        """
+        blob = self.index["sounds"].get(effect)
+        if blob is None or list(mixer.get_init()) != self.index["mixer"]:
+            return None
+        offset, length = blob
+        return mixer.Sound(buffer=self.view[offset:offset + length])
+
+    def surface(self, blob):
+        """Create a surface that uses the mapped pixels directly.
+
+        Args:
+            blob((int, int, int)): Offset, width and height of pixel data.
+        """
+        offset, width, height = blob
+        length = width * height * len(PIXEL_FORMAT)
+        return image.frombuffer(self.view[offset:offset + length],
+                                (width, height), PIXEL_FORMAT)
+
+    @classmethod
+    def open(cls, filename=BUNDLE):
+        """Open a bundle, returning None if missing, invalid or stale.
+
+        Args:
+            filename(string): Path of the bundle file.
+        """
+        if not path.exists(filename):
+            return None
+        try:
+            bundle = cls(filename)
+        except (OSError, ValueError):
+            return None
+        return bundle if bundle.current else None
+
+
+def align(offset):
+    """Return offset rounded up to the blob alignment.
+
+    Args:
+        offset(int): Byte offset.
+    """
+    return offset + -offset % ALIGNMENT
+
+
+def build(filename=BUNDLE):
+    """Decode all images and sounds and write them to a bundle file.
+
+    Args:
+        filename(string): Path of the bundle file.
+    """
+    init()
+    display.set_mode((1, 1), HIDDEN)  # Display format for conversions
+    mixer.init()
+    blobs = []
+    offset = 0
+
+    def add(data):
+        """Queue a blob and return its offset."""
+        nonlocal offset
+        blob_offset = offset
+        blobs.append(data)
+        blobs.append(bytes(align(len(data)) - len(data)))
+        offset += align(len(data))
+        return blob_offset
+
+    def add_surface(surface):
+        """Queue raw pixels of a surface and return its blob."""
+        width, height = surface.get_size()
+        return (add(image.tobytes(surface, PIXEL_FORMAT)), width, height)
+
+    GameImages.build_atlas()
+    pages = [add_surface(page) for page in GameImages.atlas]
+    regions = {filename: (GameImages.atlas.index(page), tuple(rect))
+               for filename, (page, rect) in GameImages.regions.items()}
+    images = {filename: add_surface(image.load(filename).convert_alpha())
+              for filename in IMAGES}
+    sounds = {}
+    sources = ATLAS_IMAGES + IMAGES
+    for effect in SOUND_EFFECTS:
+        source = path.join(SOUND_FOLDER, effect + ".mp3")
+        raw = mixer.Sound(source).get_raw()
+        sounds[effect] = (add(raw), len(raw))
+        sources.append(source)
+
+    index = json.dumps({
+        "display_masks": list(display.get_surface().get_masks()[:3]),
+        "mixer": list(mixer.get_init()),
+        "pages": pages,
+        "regions": regions,
+        "images": images,
+        "sounds": sounds,
+        "sources": sources,
+    }).encode()
+    end = calcsize(HEADER) + len(index)
+    with open(filename, "wb") as bundle_file:
+        bundle_file.write(pack(HEADER, MAGIC, VERSION, len(index)))
+        bundle_file.write(index)
+        bundle_file.write(bytes(align(end) - end))
+        bundle_file.writelines(blobs)
+
+
+if __name__ == "__main__":
+    build()
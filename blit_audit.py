@@ -0,0 +1,148 @@
+"""Blit auditor."""
+import atexit
+from game_images import GameImages
+from pygame import display, SRCALPHA
+from time import perf_counter
+from weakref import WeakKeyDictionary
+
+REPORT_INTERVAL = 10  # Seconds between periodic reports
+
+
+class BlitAudit:
+    """Collects the cost of blits per source surface.
+
+    For each source surface the report shows its pixel format, whether it
+    matches the display format (a mismatch is converted on every blit),
+    whether it uses per-pixel alpha or a colorkey, and the cumulative blit
+    count, area and time.  The report is printed periodically and at exit.
+    """
+
+    def __init__(self, interval=REPORT_INTERVAL):
+        """Blit auditor constructor.
+
+        Args:
+            interval(float): Seconds between reports. (default=10)
+        """
+        self.interval = interval
+        self.last_report = perf_counter()
+        self.stats = {}  # Key=(label, format), value=[blits, area, seconds]
+        self.names = WeakKeyDictionary()  # Key=surface, value=label
+        # Key=flipped, resized or rotated copy, value=(surface, description)
+        self.origins = WeakKeyDictionary()
+        GameImages.audit = self  # Name surfaces as they are registered
+        self.name_images()
+        atexit.register(self.report)
+
+    def name(self, surface, name):
+        """Name a surface loaded from an image file.
+
+        Args:
+            surface(pygame.Surface): Registered surface.
+            name(string): Path of the image file.
+        """
+        self.names[surface] = name
+
+    def derived(self, copy, source, description):
+        """Note that a surface is a flipped, resized or rotated copy.
+
+        Args:
+            copy(pygame.Surface): Derived surface.
+            source(pygame.Surface): Surface it was derived from.
+            description(string): How it was derived, e.g. "flipped".
+        """
+        self.origins[copy] = (source, description)
+
+    def label(self, surface):
+        """Return a readable name for a surface.
+
+        Args:
+            surface(pygame.Surface): Source surface of a blit.
+        """
+        descriptions = []
+        while surface in self.origins:
+            surface, description = self.origins[surface]
+            descriptions.append(description)
+        name = self.names.get(surface)
+        if name is None:  # Text, layers and other composed surfaces
+            name = self.unnamed(surface)
+            self.names[surface] = name
+        return " ".join([name] + descriptions)
+
+    @staticmethod
+    def unnamed(surface):
+        """Return a name for a surface not loaded from an image file.
+
+        Args:
+            surface(pygame.Surface): Surface to name.
+        """
+        width, height = surface.get_size()
+        return f"{width}x{height} surface"
+
+    def name_images(self):
+        """Name the surfaces registered before auditing began.
+
+        Frames of a sprite sheet are grouped under the sheet's file name
+        and rotations are labelled as rotated copies of their frames.
+        """
+        for filename, surface in list(GameImages.surfaces.items()):
+            self.names[surface] = filename
+        for (filename, _, _, _), surface in list(GameImages.frames.items()):
+            self.names[surface] = filename
+        for (surface, index), rotated in list(GameImages.rotations.items()):
+            if index:
+                self.derived(rotated, surface, "rotated")
+
+    @staticmethod
+    def describe(surface):
+        """Return the pixel format, display match and transparency.
+
+        Args:
+            surface(pygame.Surface): Source surface of a blit.
+        """
+        screen = display.get_surface()
+        matches = (surface.get_bitsize() == screen.get_bitsize() and
+                   surface.get_masks()[:3] == screen.get_masks()[:3])
+        if surface.get_flags() & SRCALPHA:
+            transparency = "per-pixel alpha"
+        elif surface.get_colorkey() is not None:
+            transparency = "colorkey"
+        else:
+            transparency = "opaque"
+        return (f"{surface.get_bitsize()}-bit",
+                "display" if matches else "CONVERTED", transparency)
+
+    def record(self, source, area, seconds):
+        """Record one blit.
+
+        Args:
+            source(pygame.Surface): Source surface.
+            area(int): Pixels drawn.
+            seconds(float): Time taken.
+        """
+        key = (self.label(source), self.describe(source))
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = [0, 0, 0.0]
+            self.stats[key] = stats
+        stats[0] += 1
+        stats[1] += area
+        stats[2] += seconds
+
+    def tick(self):
+        """Print a report if the report interval has passed."""
+        if perf_counter() - self.last_report >= self.interval:
+            self.report()
+
+    def report(self):
+        """Print cumulative blit costs, most expensive first."""
+        self.last_report = perf_counter()
+        if not self.stats:
+            return
+        print(f"{'Surface':<44} {'Format':<7} {'Match':<9} "
+              f"{'Transparency':<15} {'Blits':>8} {'Kpixels':>10} "
+              f"{'ms':>9} {'us/blit':>8}")
+        for (name, (bits, match, transparency)), (blits, area, seconds) in (
+                sorted(self.stats.items(), key=lambda item: -item[1][2])):
+            print(f"{name[:44]:<44} {bits:<7} {match:<9} {transparency:<15} "
+                  f"{blits:>8} {area // 1000:>10} {seconds * 1000:>9.1f} "
+                  f"{seconds * 1e6 / blits:>8.1f}")
@@ -1,6 +1,8 @@
 """Bomb."""
 from math import copysign
-from pygame import image, sprite, transform, Vector2
+from game_images import GameImages
+from motion import MovingSprite
+from pygame import Rect, Vector2
 
 BOMB = "images/bomb.png"
 GRAVITY = 0.08
@@ -9,7 +11,7 @@ WIDTH = 22
 HEIGHT = 30
 
 
-class Bomb(sprite.Sprite):
+class Bomb(MovingSprite):
     """Bomb."""
 
     def __init__(self, starting_location, jet_vector):
@@ -20,20 +22,39 @@ class Bomb(sprite.Sprite):
             jet_vector(Vector2):  X, Y direction & speed of jet
         """
         super().__init__()
-        self.image = image.load(BOMB)
-        self.rect = self.image.get_rect(center=starting_location)
+        self.unrotated_image = GameImages.load(BOMB)
+        # Unrotated rectangle used for movement
+        self.body = self.unrotated_image.get_rect(center=starting_location)
         self.direction = Vector2(jet_vector)
         self.angle = 90 * copysign(1, self.direction.x)
+        self.rotate()
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """Draw bomb.
 
         Args:
-            screen(pygame.Surface): Graphical window to display graphics.
+            screen(Canvas): Game canvas.
+            alpha(float): Fraction of the last simulation step to show
         """
-        rotated_bomb = transform.rotate(self.image, self.angle)
-        rotated_rect = rotated_bomb.get_rect(center=self.rect.center)
-        screen.blit(rotated_bomb, rotated_rect)
+        screen.blit_rotated(self.unrotated_image,
+                            self.interpolate(alpha).center, self.angle)
+
+    @property
+    def image(self):
+        """Return the current pre-rotated frame, rotated when first drawn."""
+        return GameImages.rotated(self.unrotated_image, self.angle)
+
+    @staticmethod
+    def preload():
+        """Build the collision mask of every orientation of the bomb."""
+        GameImages.prerotate_masks(GameImages.load(BOMB))
+
+    def rotate(self):
+        """Set mask and rect to the current orientation."""
+        self.mask = GameImages.rotated_mask(self.unrotated_image, self.angle)
+        self.rect = Rect((0, 0), GameImages.rotated_size(self.body.size,
+                                                         self.angle))
+        self.rect.center = self.body.center
 
     def update(self):
         """Update position of the bomb."""
@@ -44,4 +65,5 @@ class Bomb(sprite.Sprite):
 
         self.direction.x *= 0.981  # Reduce X speed to simulate drag
         self.direction.y += GRAVITY  # Increase Y speed to simulate gravity
-        self.rect.move_ip(self.direction.x, self.direction.y)
+        self.body.move_ip(self.direction.x, self.direction.y)
+        self.rotate()
@@ -1,5 +1,8 @@
 """Bullet."""
-from pygame import image, mask, Rect, sprite
+from game_images import GameImages
+from motion import MovingSprite
+from pygame import Vector2
+from turret import BULLET_SPEED
 
 BULLETS = "images/bullets.png"
 BULLET_ANGLES = {
@@ -19,33 +22,57 @@ WIDTH = 10
 HEIGHT = 10
 
 
-class Bullet(sprite.Sprite):
+class Bullet(MovingSprite):
     """Bullet."""
 
-    def __init__(self, starting_location, muzzle_vector):
+    templates = {}  # Key=turret angle, value=(image, mask, velocity)
+
+    def __init__(self, starting_location, angle):
         """Initialize bullet.
 
         Args:
             starting_location(Vector2) Starting X,Y coordinates of bullet
-            muzzle_vector(Vector2):  X, Y direction & speed of bullet
+            angle(int): Turret angle in degrees (0=straight up)
         """
         super().__init__()
-        sprite_sheet = image.load(BULLETS).convert_alpha()
-        angle = round(muzzle_vector.as_polar()[1]) + 90  # Angle of bullet
-        source_rect = Rect(BULLET_ANGLES[angle] * WIDTH, 0, WIDTH, HEIGHT)
-        self.image = sprite_sheet.subsurface(source_rect)
-        self.mask = mask.from_surface(self.image)
+        self.image, self.mask, self.direction = self.template(angle)
         self.location = starting_location
         self.rect = self.image.get_rect(center=starting_location)
-        self.direction = muzzle_vector
 
-    def draw(self, screen):
+    @classmethod
+    def preload(cls):
+        """Build bullet templates for every turret angle."""
+        for angle in BULLET_ANGLES:
+            cls.template(angle)
+
+    @classmethod
+    def template(cls, angle):
+        """Return the shared spawn template for a turret angle.
+
+        Args:
+            angle(int): Turret angle in degrees (0=straight up)
+        Returns:
+            (pygame.Surface, pygame.mask.Mask, Vector2): Image, mask and
+                velocity of bullet (shared, do not modify)
+        """
+        template = cls.templates.get(angle)
+        if template is None:
+            template = (
+                GameImages.frame(BULLETS, BULLET_ANGLES[angle], WIDTH, HEIGHT),
+                GameImages.frame_mask(BULLETS, BULLET_ANGLES[angle],
+                                      WIDTH, HEIGHT),
+                Vector2(BULLET_SPEED, 0).rotate(angle - 90))
+            cls.templates[angle] = template
+        return template
+
+    def draw(self, screen, alpha=1.0):
         """Draw bullet.
 
         Args:
             screen(pygame.Surface): Graphical window to display graphics.
+            alpha(float): Fraction of the last simulation step to show
         """
-        screen.blit(self.image, self.rect)
+        screen.blit(self.image, self.interpolate(alpha))
 
     def update(self):
         """Update position of the bullet."""
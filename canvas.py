@@ -0,0 +1,637 @@
+"""Game canvas."""
+from enum import IntEnum
+from game_images import GameImages
+from pygame import display, Rect, transform
+from pygame._sdl2.video import Renderer, Texture, Window
+from time import perf_counter
+from weakref import WeakKeyDictionary
+
+SURFACE = "surface"  # Renderer blitting surfaces onto the display surface
+TEXTURE = "texture"  # Renderer copying textures with SDL's software renderer
+
+
+class Layer(IntEnum):
+    """Render layers, drawn from lowest to highest."""
+
+    HUD = 0
+    PROJECTILES = 1
+    EXPLOSIONS = 2
+    PARATROOPERS = 3
+    TURRET = 4
+    AIRCRAFT = 5
+    OVERLAY = 6
+
+
+class Canvas:
+    """Draws game frames onto the display surface.
+
+    In dirty rectangle mode only the regions drawn during the current or
+    previous frame are restored from the background and pushed to the
+    display, instead of redrawing and flipping the whole screen.
+
+    When mirrored, such as for player 2 of a cocktail cabinet, the frame is
+    drawn upside down at mirrored positions, rather than rotating the
+    finished frame.  Sprites are taken from atlas pages flipped once when
+    loading and rotated sprites from the opposite rotation, while other
+    surfaces, such as text, are flipped once when first drawn.
+
+    Blits are not drawn immediately but queued on the current layer.  Those
+    entirely off screen are culled, and each layer is flushed with a single
+    Surface.blits call when the frame is presented.
+
+    Drawing is in logical coordinates.  When the output resolution differs,
+    positions are scaled and sprites are taken from the pre-scaled atlas.
+    Rotated sprites are rotated from their pre-scaled frames, and text and
+    the score strip are drawn at the output resolution, so nothing is
+    resized per frame.  Other surfaces, such as the background, are resized
+    once into a cache.
+    """
+
+    def __init__(self, screen, dirty_rects=False, size=None):
+        """Canvas constructor.
+
+        Args:
+            screen(pygame.Surface): Display surface.
+            dirty_rects(bool): Only update regions that changed
+            size((int, int)): Logical width and height. (default=output)
+        """
+        self.screen = screen
+        self.rect = Rect((0, 0), self.get_output_size())  # Output area
+        self.size = size or self.rect.size
+        if self.size == self.rect.size:
+            self.scale = None
+        else:  # Horizontal and vertical output pixels per logical pixel
+            self.scale = (self.rect.width / self.size[0],
+                          self.rect.height / self.size[1])
+        # Key=surface, value=copy at the output resolution
+        self.resized = WeakKeyDictionary()
+        self.dirty_rects = dirty_rects
+        self.queue = [[] for _ in Layer]  # Queued blits per layer
+        self._layer = Layer.HUD
+        self.pending = self.queue[Layer.HUD]  # Queue of the current layer
+        self.previous = []  # Rects drawn during the previous frame
+        self.current = []  # Rects drawn during the current frame
+        self.full_update = True  # Redraw and update whole screen
+        self.background = None  # Background of the previous frame
+        self._mirrored = False
+        self.audit = None  # Optional BlitAudit timing each blit
+        # Key=surface, value=copy flipped horizontally and vertically
+        self.flipped = WeakKeyDictionary()
+
+    @property
+    def layer(self):
+        """Return the layer that blits are queued on."""
+        return self._layer
+
+    @layer.setter
+    def layer(self, layer):
+        """Set the layer that blits are queued on.
+
+        Args:
+            layer(Layer): Render layer
+        """
+        self._layer = layer
+        self.pending = self.queue[layer]
+
+    @property
+    def mirrored(self):
+        """Return True if frames are drawn rotated 180 degrees."""
+        return self._mirrored
+
+    @mirrored.setter
+    def mirrored(self, mirrored):
+        """Set whether frames are drawn rotated 180 degrees.
+
+        Args:
+            mirrored(bool): Rotate drawing 180 degrees
+        """
+        if mirrored != self._mirrored:
+            self._mirrored = mirrored
+            self.full_update = True
+
+    def flip(self, source):
+        """Return a shared copy of a surface rotated 180 degrees.
+
+        Args:
+            source(pygame.Surface): Surface to flip.
+        """
+        flipped = self.flipped.get(source)
+        if flipped is None:
+            page = GameImages.flipped.get(source.get_abs_parent())
+            if page is None:
+                flipped = transform.flip(source, True, True)
+            else:  # Share pixels of the flipped atlas page
+                x, y = source.get_abs_offset()
+                width, height = source.get_size()
+                flipped = page.subsurface(page.get_width() - x - width,
+                                          page.get_height() - y - height,
+                                          width, height)
+            self.flipped[source] = flipped
+            if self.audit:
+                self.audit.derived(flipped, source, "flipped")
+        return flipped
+
+    def output_position(self, position):
+        """Return a logical position in output pixels.
+
+        Args:
+            position((int, int)): Logical X, Y position.
+        """
+        if self.scale is None:
+            return position
+        return (round(position[0] * self.scale[0]),
+                round(position[1] * self.scale[1]))
+
+    def scaled_rect(self, rect):
+        """Return a logical rect in output pixels.
+
+        Edges are rounded rather than sizes, so adjacent rects still tile.
+
+        Args:
+            rect(pygame.Rect): Logical rect.
+        """
+        scale_x, scale_y = self.scale
+        left, top = round(rect.left * scale_x), round(rect.top * scale_y)
+        return Rect(left, top, round(rect.right * scale_x) - left,
+                    round(rect.bottom * scale_y) - top)
+
+    def resize(self, source):
+        """Return a shared copy of a surface at the output resolution.
+
+        Args:
+            source(pygame.Surface): Surface to resize.
+        """
+        resized = self.resized.get(source)
+        if resized is None:
+            rect = self.scaled_rect(Rect(source.get_abs_offset(),
+                                         source.get_size()))
+            page = GameImages.scaled.get(source.get_abs_parent())
+            if page is None:
+                resized = GameImages.scale(source, rect.size)
+            else:  # Share pixels of the pre-scaled atlas page
+                resized = page.subsurface(rect.clip(page.get_rect()))
+            self.resized[source] = resized
+            if self.audit:
+                self.audit.derived(resized, source, "resized")
+        return resized
+
+    def rescale(self, source, dest, area=None):
+        """Return a resized source, destination and area for a blit.
+
+        Args:
+            source(pygame.Surface): Surface to draw.
+            dest((int, int) or pygame.Rect): Logical position to draw.
+            area(pygame.Rect): Portion of source to draw. (default=None)
+        """
+        if area is not None:
+            area = self.scaled_rect(Rect(area))
+        return self.resize(source), self.output_position(dest), area
+
+    def logical(self, position):
+        """Return an output position, such as the mouse's, in logical units.
+
+        Args:
+            position((int, int)): X, Y position in output pixels.
+        """
+        if self.scale is None:
+            return position
+        return (int(position[0] / self.scale[0]),
+                int(position[1] / self.scale[1]))
+
+    def mirror(self, source, dest, area=None):
+        """Return a flipped source, destination and area for a blit.
+
+        Args:
+            source(pygame.Surface): Surface to draw.
+            dest((int, int) or pygame.Rect): Position to draw.
+            area(pygame.Rect): Portion of source to draw. (default=None)
+        """
+        width, height = source.get_size()
+        if area is None:
+            area = Rect(0, 0, width, height)
+        else:
+            area = Rect(area).clip(0, 0, width, height)
+        screen_width, screen_height = self.rect.size
+        dest = (screen_width - int(dest[0]) - area.width,
+                screen_height - int(dest[1]) - area.height)
+        area = Rect(width - area.right, height - area.bottom,
+                    area.width, area.height)
+        return self.flip(source), dest, area
+
+    def compose(self, background, rect):
+        """Return a layer to compose at the output resolution.
+
+        Args:
+            background(pygame.Surface): Logical surface under the layer.
+            rect(pygame.Rect): Logical area of the layer.
+        """
+        return Composition(self, background, rect, self._mirrored)
+
+    def begin(self, background):
+        """Begin a frame by restoring the background.
+
+        Args:
+            background(pygame.Surface): Static background layer.
+        """
+        if background is not self.background:  # Background changed
+            self.background = background
+            self.full_update = True
+        if self.scale:
+            background = self.resize(background)
+        if self._mirrored:
+            background = self.flip(background)
+        start = perf_counter()
+        if self.dirty_rects and not self.full_update:
+            self.screen.blits([(background, rect, rect)
+                               for rect in self.previous], doreturn=0)
+            area = sum(rect.width * rect.height for rect in self.previous)
+        else:
+            self.screen.blit(background, (0, 0))
+            area = self.rect.width * self.rect.height
+        if self.audit:
+            self.audit.record(background, area, perf_counter() - start)
+        self.current = []
+        self.layer = Layer.HUD
+        for queue in self.queue:  # Discard any frame never presented
+            queue.clear()
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Queue a surface to draw on the current layer.
+
+        Args:
+            source(pygame.Surface): Surface to draw.
+            dest((int, int) or pygame.Rect): Position to draw.
+            area(pygame.Rect): Portion of source to draw. (default=None)
+            special_flags(int): Blend flags. (default=0)
+        Returns:
+            pygame.Rect: Area of the screen that will be drawn
+        """
+        if self.scale:
+            source, dest, area = self.rescale(source, dest, area)
+        return self.blit_output(source, dest, area, special_flags)
+
+    def blit_output(self, source, dest, area=None, special_flags=0):
+        """Queue a surface already at the output resolution.
+
+        Args:
+            source(pygame.Surface): Surface to draw.
+            dest((int, int) or pygame.Rect): Position in output pixels.
+            area(pygame.Rect): Portion of source to draw. (default=None)
+            special_flags(int): Blend flags. (default=0)
+        Returns:
+            pygame.Rect: Area of the screen that will be drawn
+        """
+        if self._mirrored:
+            source, dest, area = self.mirror(source, dest, area)
+        return self.enqueue(source, dest, area, special_flags)
+
+    def enqueue(self, source, dest, area=None, special_flags=0):
+        """Queue a blit in output pixels, already mirrored if need be.
+
+        Args:
+            source(pygame.Surface): Surface to draw.
+            dest((int, int) or pygame.Rect): Position in output pixels.
+            area(pygame.Rect): Portion of source to draw. (default=None)
+            special_flags(int): Blend flags. (default=0)
+        Returns:
+            pygame.Rect: Area of the screen that will be drawn
+        """
+        if area is None:
+            width, height = source.get_size()
+        else:
+            width, height = Rect(area).clip(source.get_rect()).size
+        rect = self.rect.clip(dest[0], dest[1], width, height)
+        if rect:  # Cull blits entirely off screen
+            self.pending.append((source, dest, area, special_flags))
+            if self.dirty_rects:
+                self.current.append(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=1):
+        """Queue many surfaces to draw on the current layer.
+
+        Args:
+            blit_sequence(iterable): (source, dest[, area[, flags]]) tuples.
+            doreturn(bool): Return list of rects drawn. (default=1)
+        """
+        blit = self.blit
+        rects = [blit(*entry) for entry in blit_sequence]
+        return rects if doreturn else None
+
+    def blit_rotated(self, source, center, angle):
+        """Queue a rotated surface to draw on the current layer.
+
+        When scaled, the pre-scaled frame is rotated, so rotated frames are
+        never resized.  When mirrored, the opposite rotation is drawn at the
+        mirrored position, as rotating a frame 180 degrees more flips it.
+
+        Args:
+            source(pygame.Surface): Shared surface from the image registry.
+            center((int, int)): Position of the center of rotation.
+            angle(float): Counterclockwise rotation in degrees.
+        Returns:
+            pygame.Rect: Area of the screen that will be drawn
+        """
+        if self.scale:
+            source = self.resize(source)
+            center = self.output_position(center)
+        if not self._mirrored:
+            rotated = GameImages.rotated(source, angle)
+            return self.enqueue(rotated, rotated.get_rect(center=center))
+        rotated = GameImages.rotated(source, angle + 180)
+        rect = rotated.get_rect(center=center)
+        return self.enqueue(rotated, (self.rect.width - rect.right,
+                                      self.rect.height - rect.bottom))
+
+    def blit_sprites(self, sprites, alpha=1.0):
+        """Queue the image of each sprite at its rect on the current layer.
+
+        Faster than blits for many small sprites, such as shrapnel, as each
+        rect is the size of its image and culling needs no clipping.  When
+        mirrored or scaled, each sprite draws itself, so rotating sprites
+        draw from their pre-scaled frames.
+
+        Args:
+            sprites(iterable): Moving sprites with image, rect and
+                draw(canvas, alpha).
+            alpha(float): Fraction of the last simulation step to show
+        """
+        if self._mirrored or self.scale:
+            for sprite in sprites:
+                sprite.draw(self, alpha)
+            return
+        if alpha < 1:
+            entries = [(sprite.image, sprite.interpolate(alpha))
+                       for sprite in sprites]
+        else:
+            entries = [(sprite.image, sprite.rect) for sprite in sprites]
+        screen = self.rect
+        visible = [entry for entry in entries if screen.colliderect(entry[1])]
+        self.pending.extend(visible)
+        if self.dirty_rects:
+            self.current.extend(screen.clip(rect) for _, rect in visible)
+
+    def flush(self):
+        """Draw queued blits, one Surface.blits call per layer.
+
+        When auditing, blits are drawn one at a time so each can be timed.
+        """
+        for queue in self.queue:
+            if not queue:
+                continue
+            if self.audit:
+                for blit in queue:
+                    start = perf_counter()
+                    rect = self.screen.blit(*blit)
+                    self.audit.record(blit[0], rect.width * rect.height,
+                                      perf_counter() - start)
+            else:
+                self.screen.blits(queue, doreturn=0)
+            queue.clear()
+
+    def get_output_size(self):
+        """Return width and height of the output in pixels."""
+        return self.screen.get_size()
+
+    def get_size(self):
+        """Return logical width and height of the canvas."""
+        return self.size
+
+    def invalidate(self):
+        """Redraw and update the whole screen on the next frame."""
+        self.full_update = True
+
+    def present(self):
+        """Push the frame to the display."""
+        self.flush()
+        if self.audit:
+            self.audit.tick()
+        if self.dirty_rects and not self.full_update:
+            display.update(self.previous + self.current)
+        else:
+            display.flip()
+        self.previous = self.current
+        self.full_update = False
+
+
+class Composition:
+    """Cached layer drawn on at the output resolution in logical coordinates.
+
+    Layers rebuilt only when their contents change, such as the score strip,
+    are composed from pre-scaled surfaces, so drawing them needs no
+    resizing.  A mirrored layer is composed upside down from pre-flipped
+    surfaces, so it needs no flipping either.
+    """
+
+    def __init__(self, canvas, background, rect, mirrored=False):
+        """Composition constructor.
+
+        Args:
+            canvas(Canvas): Canvas the layer is drawn on.
+            background(pygame.Surface): Logical surface under the layer.
+            rect(pygame.Rect): Logical area of the layer.
+            mirrored(bool): Compose upside down. (default=False)
+        """
+        self.canvas = canvas
+        self.mirrored = mirrored
+        if canvas.scale:
+            background = canvas.resize(background)
+            area = canvas.scaled_rect(Rect(rect))
+        else:
+            area = Rect(rect)
+        area = area.clip(background.get_rect())
+        if mirrored:
+            background = canvas.flip(background)
+            area = Rect(background.get_width() - area.right,
+                        background.get_height() - area.bottom,
+                        area.width, area.height)
+        self.area = area  # Output area
+        self.surface = background.subsurface(area).copy()
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Draw a surface on the layer.
+
+        Args:
+            source(pygame.Surface): Surface to draw.
+            dest((int, int) or pygame.Rect): Logical position on the screen.
+            area(pygame.Rect): Portion of source to draw. (default=None)
+            special_flags(int): Blend flags. (default=0)
+        Returns:
+            pygame.Rect: Area of the layer drawn
+        """
+        if self.canvas.scale:
+            source, dest, area = self.canvas.rescale(source, dest, area)
+        if self.mirrored:
+            source, dest, area = self.canvas.mirror(source, dest, area)
+        return self.surface.blit(source, (dest[0] - self.area.x,
+                                          dest[1] - self.area.y),
+                                 area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        """Draw many surfaces on the layer.
+
+        Args:
+            blit_sequence(iterable): (source, dest[, area[, flags]]) tuples.
+            doreturn(bool): Return list of rects drawn. (default=1)
+        """
+        blit = self.blit
+        rects = [blit(*entry) for entry in blit_sequence]
+        return rects if doreturn else None
+
+    def draw(self):
+        """Queue the layer on the current layer of its canvas.
+
+        Returns:
+            pygame.Rect: Area of the screen that will be drawn
+        """
+        if self.mirrored:  # Already upside down
+            return self.canvas.enqueue(self.surface, self.area.topleft)
+        return self.canvas.blit_output(self.surface, self.area.topleft)
+
+
+class TextureCanvas(Canvas):
+    """Draws game frames with SDL's software renderer.
+
+    Each surface is uploaded once as a texture and copied to the window.
+    Rotation is applied as textures are copied, so no rotated surfaces are
+    created.  Mirrored frames are drawn from pre-flipped surfaces, as
+    flipped copies are an order of magnitude slower in the software
+    renderer.  Blits are drawn as they are queued, and dirty rectangles are
+    not used since every frame is presented whole.
+
+    Surfaces must not be changed once drawn, as their texture is reused.
+    Textures are uploaded already resized to the output resolution.
+    """
+
+    def __init__(self, size, output_size=None, full_screen=False,
+                 vsync=False):
+        """Texture canvas constructor.
+
+        Args:
+            size((int, int)): Logical width and height.
+            output_size((int, int)): Width and height of the window.
+                (default=size)
+            full_screen(bool): Fill the desktop. (default=False)
+            vsync(bool): Present waits for the display refresh.
+                (default=False)
+        """
+        self.window = Window(size=output_size or size,
+                             fullscreen_desktop=full_screen)
+        self.renderer = Renderer(self.window, accelerated=0, vsync=vsync)
+        self.textures = WeakKeyDictionary()  # Key=surface, value=texture
+        super().__init__(None, size=size)
+
+    def texture(self, source):
+        """Return the shared texture of a surface, uploading it once.
+
+        Args:
+            source(pygame.Surface): Surface to upload.
+        """
+        texture = self.textures.get(source)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, source)
+            self.textures[source] = texture
+        return texture
+
+    def copy(self, source, area, rect, angle=0):
+        """Copy a texture to the window.
+
+        Args:
+            source(pygame.Surface): Surface to draw.
+            area(pygame.Rect): Portion of source to draw or None.
+            rect(pygame.Rect): Destination, already mirrored if need be.
+            angle(float): Counterclockwise rotation in degrees. (default=0)
+        """
+        texture = self.texture(source)
+        if self.audit:
+            start = perf_counter()
+        texture.draw(area, rect, -angle)
+        if self.audit:
+            self.audit.record(source, rect.width * rect.height,
+                              perf_counter() - start)
+
+    def begin(self, background):
+        """Begin a frame by drawing the background.
+
+        Args:
+            background(pygame.Surface): Static background layer.
+        """
+        self.background = background
+        self.layer = Layer.HUD
+        if self.scale:
+            background = self.resize(background)
+        if self._mirrored:
+            background = self.flip(background)
+        self.copy(background, None, self.rect)
+
+    def enqueue(self, source, dest, area=None, special_flags=0):
+        """Draw a surface in output pixels, already mirrored if need be.
+
+        Args:
+            source(pygame.Surface): Surface to draw.
+            dest((int, int) or pygame.Rect): Position in output pixels.
+            area(pygame.Rect): Portion of source to draw. (default=None)
+            special_flags(int): Ignored, textures use alpha blending.
+        Returns:
+            pygame.Rect: Area of the screen drawn
+        """
+        if area is not None:
+            area = Rect(area).clip(source.get_rect())
+        rect = Rect((int(dest[0]), int(dest[1])),
+                    source.get_size() if area is None else area.size)
+        visible = rect.clip(self.rect)
+        if visible:  # Cull blits entirely off screen
+            self.copy(source, area, rect)
+        return visible
+
+    def blit_rotated(self, source, center, angle):
+        """Draw a surface rotated as it is copied.
+
+        When mirrored, the flipped surface is rotated by the same angle at
+        the mirrored position.
+
+        Args:
+            source(pygame.Surface): Surface to draw.
+            center((int, int)): Position of the center of rotation.
+            angle(float): Counterclockwise rotation in degrees.
+        Returns:
+            pygame.Rect: Area of the screen drawn
+        """
+        if self.scale:
+            source = self.resize(source)
+            center = self.output_position(center)
+        rect = source.get_rect(center=center)
+        if self._mirrored:
+            source = self.flip(source)
+            rect = Rect(self.rect.width - rect.right,
+                        self.rect.height - rect.bottom,
+                        rect.width, rect.height)
+        size = max(rect.size) * 3 // 2  # Covers any rotation of the rect
+        bounds = Rect(0, 0, size, size)
+        bounds.center = rect.center
+        bounds = bounds.clip(self.rect)
+        if bounds:
+            self.copy(source, None, rect, angle)
+        return bounds
+
+    def blit_sprites(self, sprites, alpha=1.0):
+        """Draw sprites, which may rotate themselves as they are copied.
+
+        Args:
+            sprites(iterable): Moving sprites with a draw(canvas, alpha)
+                method.
+            alpha(float): Fraction of the last simulation step to show
+        """
+        for sprite in sprites:
+            sprite.draw(self, alpha)
+
+    def get_output_size(self):
+        """Return width and height of the output in pixels."""
+        return self.window.size
+
+    def present(self):
+        """Push the frame to the window."""
+        self.renderer.present()
+        if self.audit:
+            self.audit.tick()
+        self.full_update = False
@@ -1,5 +1,7 @@
 """Explosion."""
-from pygame import image, mask, Rect, sprite, transform, Vector2
+from game_images import GameImages
+from motion import MovingSprite
+from pygame import Rect, sprite, Vector2
 from random import sample, uniform
 
 GRAVITY = .2
@@ -19,8 +21,17 @@ SIZES = {
     "turret": (25, 25)
 }
 
+# Highest sprite sheet frame of fragments that are hazardous
+HAZARD_RANGES = {
+    "bomb": 4,
+    "helicopter": 4,
+    "jet": 4,
+    "paratrooper": 4,
+    "turret": 11
+}
+
 
-class Shrapnel(sprite.Sprite):
+class Shrapnel(MovingSprite):
     """Shrapnel."""
 
     def __init__(self, image, starting_location, initial_velocity, hazardous):
@@ -33,32 +44,57 @@ class Shrapnel(sprite.Sprite):
             hazardous(bool): Shrapnel is hazardous to other objects
         """
         super().__init__()
-        self.image = image
-        self.rect = self.image.get_rect(center=starting_location)
+        self.unrotated_image = image
+        # Unrotated rectangle used for movement
+        self.body = image.get_rect(center=starting_location)
         self.direction = Vector2(initial_velocity)
         self.direction.x += uniform(-3, 3)
         self.direction.y += uniform(-5, 3)
         self.angular_velocity = uniform(-5, 5)
         self.angle = 0
         self.hazardous = hazardous
-        if self.hazardous:
-            self.mask = mask.from_surface(self.image)
+        self.rotate()
+
+    def draw(self, surface, alpha=1.0):
+        """Draw shrapnel.
+
+        Args:
+            surface(Canvas): Game canvas.
+            alpha(float): Fraction of the last simulation step to show
+        """
+        surface.blit_rotated(self.unrotated_image,
+                             self.interpolate(alpha).center, self.angle)
+
+    @property
+    def image(self):
+        """Return the current pre-rotated frame, rotated when first drawn."""
+        return GameImages.rotated(self.unrotated_image, self.angle)
 
-    def draw(self, surface):
-        """Draw shrapnel."""
-        rotated_image = transform.rotate(self.image, self.angle)
-        surface.blit(rotated_image, self.rect.center)
+    def rotate(self):
+        """Set rect, and the mask of hazardous pieces, to the current angle.
+
+        Only hazardous pieces are checked for collisions.
+        """
+        if self.hazardous:
+            self.mask = GameImages.rotated_mask(self.unrotated_image,
+                                                self.angle)
+        self.rect = Rect((0, 0), GameImages.rotated_size(self.body.size,
+                                                         self.angle))
+        self.rect.center = self.body.center
 
     def update(self):
         """Update position of the shrapnel."""
         self.angle += self.angular_velocity
         self.direction.y += GRAVITY  # Increase Y speed to simulate gravity
-        self.rect.move_ip(self.direction)
+        self.body.move_ip(self.direction)
+        self.rotate()
 
 
 class Explosion:
     """Explosion."""
 
+    templates = {}  # Key=blast type, value=[shrapnel images]
+
     def __init__(self, screen_width, screen_height, blast_center, blast_type,
                  initial_velocity, hazardous=True):
         """Initialize explosion.
@@ -74,37 +110,72 @@ class Explosion:
         self.screen_width = screen_width
         self.screen_height = screen_height
 
-        sprite_sheet = image.load(SPRITESHEETS[blast_type])
         self.exploding_pieces = sprite.Group()
         if blast_type == "turret":
             random_numbers = sample(range(0, 12), 6) + sample(range(5, 64), 32)
-            hazard_range = 11
         else:
             random_numbers = sample(range(0, 5), 1) + sample(range(5, 64), 11)
-            hazard_range = 4
+        hazard_range = HAZARD_RANGES[blast_type]
+        fragments = self.template(blast_type)
         for index in random_numbers:
-            source = Rect(index * SIZES[blast_type][0], 0,
-                          SIZES[blast_type][0], SIZES[blast_type][1])
             self.exploding_pieces.add(
-                Shrapnel(sprite_sheet.subsurface(source),
+                Shrapnel(fragments[index],
                          blast_center,
                          initial_velocity,
                          hazardous and index <= hazard_range,  # Hazardous
                          ))
 
+    @classmethod
+    def preload(cls):
+        """Build shrapnel templates and the masks of hazardous fragments.
+
+        Hazardous shrapnel collides using the mask of its current
+        orientation, so every orientation of those fragments is masked.
+        Rotated frames are only built as they are drawn.
+        """
+        for blast_type in SPRITESHEETS:
+            fragments = cls.template(blast_type)
+            for fragment in fragments[:HAZARD_RANGES[blast_type] + 1]:
+                GameImages.prerotate_masks(fragment)
+
+    @classmethod
+    def template(cls, blast_type):
+        """Return the shared fragment images of a blast type.
+
+        Args:
+            blast_type(string): Type of object exploding
+        Returns:
+            [pygame.Surface]: Fragment images indexed by sprite sheet frame
+        """
+        template = cls.templates.get(blast_type)
+        if template is None:
+            sprite_sheet = SPRITESHEETS[blast_type]
+            width, height = SIZES[blast_type]
+            template = [
+                GameImages.frame(sprite_sheet, index, width, height)
+                for index in range(GameImages.load(sprite_sheet).get_width()
+                                   // width)]
+            cls.templates[blast_type] = template
+        return template
+
     @property
     def count(self):
         """Return the current number of exploding pieces."""
         return len(self.exploding_pieces)
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """Draw all exploding pieces.
 
         Args:
-            screen(pygame.Surface): Graphical window to display graphics.
+            screen(Canvas): Game canvas.
+            alpha(float): Fraction of the last simulation step to show
         """
+        screen.blit_sprites(self.exploding_pieces, alpha)
+
+    def save_position(self):
+        """Save the rect of each piece before a simulation step."""
         for piece in self.exploding_pieces:
-            piece.draw(screen)
+            piece.save_position()
 
     def get_hazardous(self):
         """Return hazardous sprites.
@@ -1,19 +1,23 @@
 """Sabotage game board."""
-from game_fonts import GameFonts, Size
-from game_sounds import GameSounds
-from pygame import (
-    Color, draw, event, image, key, Rect, sprite, quit, time, transform)
-from pygame.locals import KEYDOWN, KEYUP, QUIT
+from game_fonts import Size
+from game_images import GameImages
+from pygame import Color, draw, key, Rect, sprite, Surface
 
 
 BUNKER = "images/bunker.png"
 LIVES = "images/lives.png"
+SKY_COLOR = Color("skyblue4")
+GROUND_COLOR = Color("forestgreen")
+FPS_COLOR = Color("yellow")
+SCORE_COLOR = Color("white")  # Current player
+IDLE_SCORE_COLOR = Color("grey")  # Waiting player
 
 
 class Board:
     """Sabotage game board."""
 
-    def __init__(self, screen_width, screen_height, key_select, key_exit):
+    def __init__(self, screen_width, screen_height, key_select, key_exit,
+                 fonts):
         """Create game board.
 
         Args:
@@ -21,6 +25,7 @@ class Board:
             screen_height (int): Overall screen height of game.
             key_select(pygame.key): Keyboard key for selection
             key_exit(pygame.key): Keyboard key to exit game
+            fonts(GameFonts): Shared game fonts
         """
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -29,27 +34,50 @@ class Board:
         self.key_select = key_select
         self.key_exit = key_exit
 
-        self.fonts = GameFonts()
+        self.fonts = fonts
 
         h = self.fonts.medium.get_height()
         self.ground_y = screen_height - h - 6
         self.ground_rect = Rect(0, self.ground_y, screen_width, h + 6)
 
-        self.bunker = image.load(BUNKER)
+        self.bunker = GameImages.load(BUNKER)
         self.bunker_pos = (((screen_width - self.bunker.get_width()) // 2),
                            self.ground_y - self.bunker.get_height())
         self.bunker_rect = self.bunker.get_rect(topleft=self.bunker_pos)
 
-        self.lives = image.load(LIVES)
+        self.lives = GameImages.load(LIVES)
         self.lives_rect = self.bunker.get_rect()
-        self.score_width, score_height = self.fonts.measure("000000",
-                                                            Size.MEDIUM)
+        self.score_width, score_height = self.fonts.measure_glyphs(
+            "000000", Size.MEDIUM)
         self.score_y = self.screen_height - (score_height + 1)
         self.lives_width = self.lives.get_width()
         self.lives_y = self.screen_height - (self.lives.get_height() + 1)
-        self.sounds = GameSounds()
+        fps_width, fps_height = self.fonts.measure_glyphs("FPS: 00",
+                                                          Size.SMALL)
+        self.fps_pos = ((self.screen_width - fps_width) // 2,
+                        self.screen_height - fps_height)
+        # Score & lives strip, rebuilt only when its contents change
+        hud_y = min(self.score_y, self.lives_y)
+        self.hud_rect = Rect(0, hud_y, screen_width, screen_height - hud_y)
+        self.hud = None  # Composition of the strip
+        self.hud_state = None
 
         self.border = sprite.Group()
+        self.layer = None  # Static background layer
+
+    @property
+    def background(self):
+        """Return the static background layer, composing it if needed.
+
+        The layer is in the display format so restoring a frame is a single
+        blit.
+        """
+        if self.layer is None:
+            self.layer = Surface((self.screen_width,
+                                  self.screen_height)).convert()
+            self.layer.fill(SKY_COLOR)
+            self.draw(self.layer)
+        return self.layer
 
     def draw(self, screen):
         """Draw the play area.
@@ -58,7 +86,7 @@ class Board:
             screen(pygame.Surface): Graphical window to display graphics.
         """
         # Draw ground
-        draw.rect(screen, "forestgreen", self.ground_rect)
+        draw.rect(screen, GROUND_COLOR, self.ground_rect)
 
         # Draw bunker
         screen.blit(self.bunker, self.bunker_pos)
@@ -71,11 +99,8 @@ class Board:
             clock(pygame.time.Clock): Game clock
         """
         fps_text = f"FPS: {int(clock.get_fps())}"
-        fps_width, fps_height = self.fonts.measure("FPS: 00", Size.SMALL)
-        fps_pos = ((self.screen_width - fps_width) // 2,
-                   self.screen_height - fps_height)
-        self.fonts.draw(fps_text, Size.SMALL, fps_pos, screen,
-                        Color("Yellow"), center=False)
+        self.fonts.draw_glyphs(fps_text, Size.SMALL, self.fps_pos, screen,
+                               FPS_COLOR)
 
     def draw_score(self, scores, lives, screen, current_player):
         """Display the player's score.
@@ -83,36 +108,39 @@ class Board:
         Args:
             scores((int,int)): The scores for players 1 and 2
             lives((int,int)): The lives left for players 1 and 2
-            screen(pygame.Surface): Graphical window to display graphics
+            screen(Canvas): Game canvas
             current_player(int): Player ID of current player
         """
-        for player_id in range(len(scores)):
-            color = "white" if player_id == current_player else "grey"
-            score_text = f"{scores[player_id]:0>6}"
-            score_x = ((self.screen_width // 4 +
-                        self.screen_width // 2 * player_id) -
-                       self.score_width // 2)
-            self.fonts.draw(score_text, Size.MEDIUM, (score_x, self.score_y),
-                            screen, Color(color))
-            for life in range(lives[player_id] + 1):
-                if player_id:
-                    lives_x = (score_x + self.score_width +
-                               (self.lives_width + 5) * (life + 1))
-                else:
-                    lives_x = score_x - (self.lives_width + 5) * (life + 2)
-                screen.blit(self.lives, (lives_x, self.lives_y))
-
-    def display_wave_number(self, wave_number, player_id, cocktail,
-                            screen, display, delay=2500):
-        """Display wave number.
+        state = (tuple(scores), tuple(lives), current_player, screen.mirrored)
+        if state != self.hud_state:  # Rebuild strip at the output resolution
+            self.hud_state = state
+            self.hud = screen.compose(self.background, self.hud_rect)
+            for player_id in range(len(scores)):
+                color = (SCORE_COLOR if player_id == current_player
+                         else IDLE_SCORE_COLOR)
+                score_text = f"{scores[player_id]:0>6}"
+                score_x = ((self.screen_width // 4 +
+                            self.screen_width // 2 * player_id) -
+                           self.score_width // 2)
+                self.fonts.draw_glyphs(score_text, Size.MEDIUM,
+                                       (score_x, self.score_y), self.hud,
+                                       color)
+                for life in range(lives[player_id] + 1):
+                    if player_id:
+                        lives_x = (score_x + self.score_width +
+                                   (self.lives_width + 5) * (life + 1))
+                    else:
+                        lives_x = score_x - (self.lives_width + 5) * (life + 2)
+                    self.hud.blit(self.lives, (lives_x, self.lives_y))
+        self.hud.draw()
+
+    def draw_wave_number(self, wave_number, player_id, canvas):
+        """Draw wave number banner.
 
         Args:
             wave_number(int): Wave number.
             player_id(int): ID of current player (zero based)
-            cocktail(bool): Indicates if cocktail mode enabled
-            screen(pygame.Surface): Graphical window to display graphics
-            display(pygame.display): Visual output
-            delay(int): Delay to show wave number on screen (milliseconds)
+            canvas(Canvas): Game canvas, mirrored for cocktail player 2
         """
         h = self.fonts.level.get_height()
         center_x, center_y = self.center
@@ -120,39 +148,23 @@ class Board:
         self.fonts.draw(level_text,
                         Size.LEVEL,
                         (center_x, center_y - h),
-                        screen,
+                        canvas,
                         Color("white"),
                         center=True)
         ready_text = f"Player {player_id + 1} Get Ready!"
         self.fonts.draw(ready_text,
                         Size.LARGE,
                         (center_x, center_y + h),
-                        screen,
+                        canvas,
                         Color("turquoise"),
                         center=True)
 
-        # Check for cocktail mode
-        if cocktail and player_id == 1:
-            # Rotate text 180 degrees
-            text_rect = Rect(0, center_y - 1.5 * h, self.screen_width, 3 * h)
-            text_subsurface = screen.subsurface(text_rect)
-            rotated_text_subsurface = transform.rotate(text_subsurface, 180)
-            screen.blit(rotated_text_subsurface, text_rect.topleft)
-
-        display.flip()
-        waiting = True
-        pause = time.get_ticks()
-        while waiting:  # Pause until CTRL pressed or ESC to quit
-            if time.get_ticks() - pause > delay:
-                break
-
-    def game_over(self, level, screen, display):
-        """Display game over and wait for select key press and release.
+    def draw_game_over(self, level, canvas):
+        """Draw game over banner.
 
         Args:
             level(int): Level number to resume
-            screen(pygame.Surface): Graphical window to display graphics.
-            display(pygame.display): Visual output.
+            canvas(Canvas): Game canvas
         """
         game_text = " Game "
         _, game_height = self.fonts.measure(game_text, Size.CODA)
@@ -160,7 +172,7 @@ class Board:
         self.fonts.draw(game_text,
                         Size.CODA,
                         (self.center[0], game_y),
-                        screen,
+                        canvas,
                         Color("white"),
                         center=True)
 
@@ -168,7 +180,7 @@ class Board:
         self.fonts.draw(over_text,
                         Size.CODA,
                         self.center,
-                        screen,
+                        canvas,
                         Color("white"),
                         center=True)
 
@@ -179,18 +191,6 @@ class Board:
         self.fonts.draw(msg_text,
                         Size.SMALL,
                         (self.center[0], msg_y),
-                        screen,
+                        canvas,
                         Color("yellow"),
                         center=True)
-
-        display.flip()
-        waiting = True
-        event.clear()
-        while waiting:  # Pause until CTRL pressed or ESC to quit
-            for e in event.get():
-                if (e.type == QUIT or
-                        e.type == KEYDOWN and e.key == self.key_exit):
-                    quit()
-                    exit()
-                elif e.type == KEYUP and e.key == self.key_select:
-                    waiting = False
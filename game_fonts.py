@@ -1,9 +1,13 @@
 """Game fonts."""
+from collections import OrderedDict
 from enum import Enum
 from os import path
-from pygame import font, transform
+from pygame import BLEND_RGBA_ADD, font, Rect, SRCALPHA, Surface
+from string import digits
 
 FONT_FOLDER = "fonts"
+CACHE_SIZE = 128  # Maximum rendered text surfaces and measurements kept
+GLYPHS = "".join(map(chr, range(32, 127)))  # Printable ASCII in glyph atlases
 
 
 class Size(Enum):
@@ -17,57 +21,198 @@ class Size(Enum):
     CODA = 6
 
 
+# Font file and point size of each size
+FACES = {
+    Size.SMALL: ("E4_2017.ttf", 20),
+    Size.MEDIUM: ("PressStart2P.ttf", 20),
+    Size.LARGE: ("PressStart2P.ttf", 30),
+    Size.HUGE: ("graphicpixel.ttf", 130),
+    Size.LEVEL: ("ka1.ttf", 72),
+    Size.CODA: ("puente.ttf", 96),
+}
+
+
 class GameFonts:
     """Create class for tail sprites that look like squares."""
 
+    instance = None  # Process-wide shared fonts
+
     def __init__(self):
         """Game fonts constructor."""
-        self.small = font.Font(path.join(FONT_FOLDER, "E4_2017.ttf"), 20)
-        self.medium = font.Font(path.join(FONT_FOLDER, "PressStart2P.ttf"), 20)
-        self.large = font.Font(path.join(FONT_FOLDER, "PressStart2P.ttf"), 30)
-        self.huge = font.Font(path.join(FONT_FOLDER, "graphicpixel.ttf"), 130)
-        self.level = font.Font(path.join(FONT_FOLDER, "ka1.ttf"), 72)
-        self.coda = font.Font(path.join(FONT_FOLDER, "puente.ttf"), 96)
+        self.faces = {size: font.Font(path.join(FONT_FOLDER, filename), points)
+                      for size, (filename, points) in FACES.items()}
+        self.small = self.faces[Size.SMALL]
+        self.medium = self.faces[Size.MEDIUM]
+        self.large = self.faces[Size.LARGE]
+        self.huge = self.faces[Size.HUGE]
+        self.level = self.faces[Size.LEVEL]
+        self.coda = self.faces[Size.CODA]
+        # Text drawn on a canvas is rendered at the output resolution
+        self.output_scale = None  # Output pixels per logical pixel
+        self.output_faces = {}  # Key=size, value=font at output resolution
+        # Least recently used caches of rendered text and measurements
+        self.rendered = OrderedDict()
+        self.measured = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.atlases = {}  # Key=(size, color), value=(atlas, glyph layout)
+
+    @classmethod
+    def shared(cls):
+        """Return the process-wide fonts, loading them on first use."""
+        if cls.instance is None:
+            cls.instance = cls()
+        return cls.instance
 
     def draw(self, text, size, position, screen, color,
-             background=None, center=False, flip=False):
+             background=None, center=False):
         """Draw text.
 
         Args:
             text(string): Text to draw.
             size(Enum): Font & size (SMALL, MEDIUM, LARGE, HUGE, CODA).
             position((int, int)): X, Y position to draw font.
-            screen(pygame.Surface): Graphical window to display graphics.
+            screen(pygame.Surface or Canvas): Surface or game canvas.
             color((int, int, int)): RGB text color.
             background((int, int, int)): RGB background color. (default=None)
             center(bool): Center text on specified position.  (default=False)
-            flip(bool): Flip text 180 degrees. (default=False)
         """
-        if size == Size.SMALL:
-            text = self.small.render(text, True, color, background)
-        elif size == Size.MEDIUM:
-            text = self.medium.render(text, True, color, background)
-        elif size == Size.LARGE:
-            text = self.large.render(text, True, color, background)
-        elif size == Size.HUGE:
-            text = self.huge.render(text, True, color, background)
-        elif size == Size.LEVEL:
-            text = self.level.render(text, True, color, background)
-        elif size == Size.CODA:
-            text = self.coda.render(text, True, color, background)
+        # Canvases at another resolution draw text rendered at that size
+        output = (self.output_scale is not None and
+                  not isinstance(screen, Surface))
+        text = self.render(text, size, color, background, output)
+        x, y = screen.output_position(position) if output else position
+        if center:
+            x -= text.get_width() // 2
+            y -= text.get_height() // 2
+
+        if output:
+            screen.blit_output(text, (x, y))
         else:
-            raise ValueError("Invalid size.")
+            screen.blit(text, (x, y))
 
-        text_rect = text.get_rect(center=position)
-        if center:
-            position = (position[0] - text_rect.width // 2,
-                        position[1] - text_rect.height // 2)
+    def face(self, size):
+        """Return the font for a size.
+
+        Args:
+            size(Enum): Font & size (SMALL, MEDIUM, LARGE, HUGE, CODA).
+        """
+        try:
+            return self.faces[size]
+        except KeyError:
+            raise ValueError("Invalid size.") from None
+
+    def output_face(self, size):
+        """Return the font for a size at the output resolution.
 
-        if flip:
-            flipped_surface = transform.rotate(text, 180)
-            screen.blit(flipped_surface, position)
+        Args:
+            size(Enum): Font & size (SMALL, MEDIUM, LARGE, HUGE, CODA).
+        """
+        face = self.output_faces.get(size)
+        if face is None:
+            self.face(size)  # Check the size is valid
+            filename, points = FACES[size]
+            face = font.Font(path.join(FONT_FOLDER, filename),
+                             round(points * self.output_scale))
+            self.output_faces[size] = face
+        return face
+
+    def render(self, text, size, color, background=None, output=False):
+        """Return rendered text, reusing a cached surface when possible.
+
+        Args:
+            text(string): Text to render.
+            size(Enum): Font & size (SMALL, MEDIUM, LARGE, HUGE, CODA).
+            color((int, int, int)): RGB text color.
+            background((int, int, int)): RGB background color. (default=None)
+            output(bool): Render at the output resolution. (default=False)
+        """
+        key = (text, size, color_key(color), color_key(background), output)
+        surface = self.rendered.get(key)
+        if surface is None:
+            self.misses += 1
+            face = self.output_face(size) if output else self.face(size)
+            surface = face.render(text, True, color, background)
+            self.rendered[key] = surface
+            if len(self.rendered) > CACHE_SIZE:
+                self.rendered.popitem(last=False)  # Least recently used
         else:
-            screen.blit(text, position)
+            self.hits += 1
+            self.rendered.move_to_end(key)
+        return surface
+
+    def glyph_atlas(self, size, color):
+        """Return the glyph atlas of a font size and color, building it once.
+
+        Each glyph is rendered once side by side onto a single surface.
+        Digits are centered in cells of equal width so numbers keep a fixed
+        layout as they change.
+
+        Args:
+            size(Enum): Font & size (SMALL, MEDIUM, LARGE, HUGE, CODA).
+            color((int, int, int)): RGB text color.
+        Returns:
+            (pygame.Surface, dict): Atlas and key=character,
+                value=(area within atlas, x offset, advance)
+        """
+        key = (size, color_key(color))
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            face = self.face(size)
+            glyphs = [face.render(char, True, color) for char in GLYPHS]
+            digit_width = max(glyphs[GLYPHS.index(digit)].get_width()
+                              for digit in digits)
+            surface = Surface((sum(glyph.get_width() for glyph in glyphs),
+                               max(glyph.get_height() for glyph in glyphs)),
+                              SRCALPHA).convert_alpha()
+            surface.fill((0, 0, 0, 0))
+            layout = {}
+            x = 0
+            for char, glyph in zip(GLYPHS, glyphs):
+                # Adding to a transparent surface copies pixels unblended
+                area = surface.blit(glyph, (x, 0),
+                                    special_flags=BLEND_RGBA_ADD)
+                advance = digit_width if char in digits else area.width
+                layout[char] = (Rect(area), (advance - area.width) // 2,
+                                advance)
+                x += area.width
+            atlas = (surface, layout)
+            self.atlases[key] = atlas
+        return atlas
+
+    def draw_glyphs(self, text, size, position, screen, color):
+        """Draw text composed from a glyph atlas with a single blits call.
+
+        Suited to scores and counters that change too often to cache as
+        whole strings.  Characters outside printable ASCII are drawn as "?".
+
+        Args:
+            text(string): Text to draw.
+            size(Enum): Font & size (SMALL, MEDIUM, LARGE, HUGE, CODA).
+            position((int, int)): X, Y position to draw font.
+            screen(pygame.Surface): Graphical window to display graphics.
+            color((int, int, int)): RGB text color.
+        """
+        atlas, layout = self.glyph_atlas(size, color)
+        x, y = position
+        sequence = []
+        for char in text:
+            area, offset, advance = layout.get(char, layout["?"])
+            sequence.append((atlas, (x + offset, y), area))
+            x += advance
+        screen.blits(sequence, doreturn=0)
+
+    def measure_glyphs(self, text, size):
+        """Measure width and height of text drawn from a glyph atlas.
+
+        Args:
+            text(string): Text to measure.
+            size(Enum): Determines font and size (SMALL, MEDIUM, LARGE, HUGE).
+        """
+        # Layout depends only on size, so measure with any atlas color
+        atlas, layout = self.glyph_atlas(size, (255, 255, 255))
+        return (sum(layout.get(char, layout["?"])[2] for char in text),
+                atlas.get_height())
 
     def measure(self, text, size):
         """Measure width and height of text.
@@ -76,17 +221,26 @@ class GameFonts:
             text(string): Text to measure.
             size(Enum): Determines font and size (SMALL, MEDIUM, LARGE, HUGE).
         """
-        if size == Size.SMALL:
-            return self.small.size(text)
-        elif size == Size.MEDIUM:
-            return self.medium.size(text)
-        elif size == Size.LARGE:
-            return self.large.size(text)
-        elif size == Size.HUGE:
-            return self.huge.size(text)
-        elif size == Size.LEVEL:
-            return self.level.size(text)
-        elif size == Size.CODA:
-            return self.coda.size(text)
+        key = (text, size)
+        measurement = self.measured.get(key)
+        if measurement is None:
+            self.misses += 1
+            measurement = self.face(size).size(text)
+            self.measured[key] = measurement
+            if len(self.measured) > CACHE_SIZE:
+                self.measured.popitem(last=False)  # Least recently used
         else:
-            raise ValueError("Invalid size.")
+            self.hits += 1
+            self.measured.move_to_end(key)
+        return measurement
+
+
+def color_key(color):
+    """Return a hashable cache key for a color.
+
+    Args:
+        color(string, (int, int, int) or pygame.Color): Color or None.
+    """
+    if color is None or isinstance(color, str):
+        return color
+    return tuple(color)
@@ -0,0 +1,423 @@
+"""Game images."""
+from collections import OrderedDict
+from hashlib import sha1
+from os import makedirs, path
+from pygame import (
+    BLEND_RGBA_ADD, image, mask, Rect, SRCALPHA, Surface, transform)
+
+STANDARD = "standard"  # Asset profile using 32-bit display format
+LOW_MEMORY = "low_memory"  # Asset profile using 16-bit colorkeyed sprites
+COLORKEY = (255, 0, 255)  # Transparent color of low memory surfaces
+ATLAS_SIZE = 2048  # Maximum width & height of each atlas page
+ATLAS_PADDING = 1  # Transparent gap between packed images
+SCALE_FOLDER = path.join("cache", "atlas")  # Atlas pages pre-scaled to output
+ROTATION_CACHE_SIZE = 2048  # Maximum rotated surfaces kept
+# Sprite sheets packed into the texture atlas
+ATLAS_IMAGES = [
+    *(f"images/gun{angle}.png" for angle in
+      ("-90", "-65", "-45", "-20", "-10", "00", "10", "20", "45", "65", "90")),
+    "images/helicopter.png",
+    "images/jet.png",
+    "images/paratrooper.png",
+    "images/parachute.png",
+    "images/bullets.png",
+    "images/bomb.png",
+    "images/lives.png",
+    "images/explosion_bomb.png",
+    "images/explosion_helicopter.png",
+    "images/explosion_jet.png",
+    "images/explosion_paratrooper.png",
+    "images/explosion_turret.png",
+]
+
+
+class GameImages:
+    """Process-wide registry that loads each image file only once.
+
+    Surfaces are converted to the display format when first loaded and are
+    shared by every sprite, so the display mode must be set before use.
+    With the low memory profile, images whose transparency is all or
+    nothing are stored as 16-bit colorkeyed surfaces instead.
+    """
+
+    profile = STANDARD  # Asset profile (STANDARD or LOW_MEMORY)
+
+    atlas = []  # Atlas page surfaces
+    regions = {}  # Key=file path, value=(atlas page, rect within page)
+    surfaces = {}  # Key=file path, value=converted surface
+    frames = {}  # Key=(file path, index, width, height), value=subsurface
+    masks = {}  # Key=file path or frame key, value=collision mask
+    # Least recently used cache, key=(surface, step index), value=surface
+    rotations = OrderedDict()
+    rotated_masks = {}  # Key=(surface, step index), value=collision mask
+    rotated_sizes = {}  # Key=(width, height, step index), value=size
+    rotation_step = 5  # Angular step of pre-rotated frames in degrees
+    scaled = {}  # Key=atlas page, value=page pre-scaled to the output
+    flipped = {}  # Key=atlas or scaled page, value=page rotated 180 degrees
+    audit = None  # Optional BlitAudit naming surfaces as they are registered
+
+    @classmethod
+    def build_atlas(cls, filenames=ATLAS_IMAGES):
+        """Pack sprite sheets into as few atlas surfaces as possible.
+
+        Images are shelf packed tallest first and converted once to the
+        display's per-pixel alpha format, or with the low memory profile to
+        16-bit colorkeyed pages where possible.  Loading a packed image
+        afterwards returns a subsurface of its atlas page.
+
+        Args:
+            filenames([string]): Paths of the image files to pack.
+        """
+        sheets = [(image.load(filename).convert_alpha(), filename)
+                  for filename in filenames if filename not in cls.regions]
+        if cls.profile == LOW_MEMORY:
+            cls.pack([sheet for sheet in sheets
+                      if cls.binary_alpha(sheet[0])], colorkey=True)
+            cls.pack([sheet for sheet in sheets
+                      if not cls.binary_alpha(sheet[0])])
+        else:
+            cls.pack(sheets)
+
+    @classmethod
+    def pack(cls, sheets, colorkey=False):
+        """Pack converted images onto new atlas pages.
+
+        Args:
+            sheets([(pygame.Surface, string)]): Images and their file paths.
+            colorkey(bool): Create 16-bit colorkeyed pages
+        """
+        sheets = sorted(sheets, key=lambda sheet: sheet[0].get_height(),
+                        reverse=True)
+        pages = [[]]  # Placements per page
+        heights = [0]  # Height used per page
+        x = y = shelf_height = 0
+        for sheet, filename in sheets:
+            width, height = sheet.get_size()
+            if x + width > ATLAS_SIZE:  # Start a new shelf
+                x = 0
+                y += shelf_height + ATLAS_PADDING
+                shelf_height = 0
+            if y + height > ATLAS_SIZE:  # Start a new page
+                pages.append([])
+                heights.append(0)
+                x = y = shelf_height = 0
+            pages[-1].append((sheet, filename, Rect(x, y, width, height)))
+            heights[-1] = max(heights[-1], y + height)
+            x += width + ATLAS_PADDING
+            shelf_height = max(shelf_height, height)
+
+        for placements, height in zip(pages, heights):
+            if not placements:
+                continue
+            width = max(rect.right for _, _, rect in placements)
+            if colorkey:
+                page = Surface((width, height), 0, 16)
+                page.fill(COLORKEY)
+                page.set_colorkey(COLORKEY)
+            else:
+                page = Surface((width, height), SRCALPHA).convert_alpha()
+                page.fill((0, 0, 0, 0))
+            for sheet, filename, rect in placements:
+                if colorkey:  # Opaque pixels replace the colorkey
+                    page.blit(sheet, rect)
+                else:  # Adding to a transparent page copies pixels unblended
+                    page.blit(sheet, rect, special_flags=BLEND_RGBA_ADD)
+                cls.regions[filename] = (page, rect)
+                cls.surfaces[filename] = cls.named(page.subsurface(rect),
+                                                   filename)
+            cls.atlas.append(page)
+
+    @staticmethod
+    def binary_alpha(surface):
+        """Return True if every pixel is either fully opaque or transparent.
+
+        Args:
+            surface(pygame.Surface): Surface with per-pixel alpha.
+        """
+        visible = mask.from_surface(surface, 0).count()
+        return visible == mask.from_surface(surface, 254).count()
+
+    @classmethod
+    def install(cls, pages, regions):
+        """Install prebuilt atlas pages, such as those of an asset bundle.
+
+        Args:
+            pages([pygame.Surface]): Atlas page surfaces.
+            regions(dict): Key=file path, value=(atlas page, rect in page)
+        """
+        for filename, (page, rect) in regions.items():
+            cls.regions[filename] = (page, Rect(rect))
+            cls.surfaces[filename] = cls.named(page.subsurface(rect),
+                                               filename)
+        cls.atlas.extend(pages)
+
+    @classmethod
+    def named(cls, surface, filename):
+        """Return a newly registered surface, named for any blit audit.
+
+        Args:
+            surface(pygame.Surface): Surface added to the registry.
+            filename(string): Path of the image file it came from.
+        """
+        if cls.audit:
+            cls.audit.name(surface, filename)
+        return surface
+
+    @classmethod
+    def load(cls, filename):
+        """Return the shared, display-converted surface for an image file.
+
+        Args:
+            filename(string): Path of the image file.
+        """
+        surface = cls.surfaces.get(filename)
+        if surface is None:
+            surface = image.load(filename)
+            if cls.profile == LOW_MEMORY:
+                surface = surface.convert_alpha()
+                if cls.binary_alpha(surface):
+                    cls.pack([(surface, filename)], colorkey=True)
+                    return cls.surfaces[filename]
+            elif surface.get_flags() & SRCALPHA:
+                surface = surface.convert_alpha()  # Per-pixel alpha
+            else:
+                surface = surface.convert()  # Keeps any colorkey
+            cls.surfaces[filename] = cls.named(surface, filename)
+        return surface
+
+    @classmethod
+    def frame(cls, filename, index, width, height):
+        """Return a shared subsurface for a frame of a sprite sheet.
+
+        Args:
+            filename(string): Path of the sprite sheet image file.
+            index(int): Zero based frame index from the left of the sheet.
+            width(int): Width of each frame.
+            height(int): Height of each frame.
+        """
+        key = (filename, index, width, height)
+        subsurface = cls.frames.get(key)
+        if subsurface is None:
+            sheet = cls.load(filename)
+            subsurface = sheet.subsurface(Rect(index * width, 0,
+                                               width, height))
+            cls.frames[key] = cls.named(subsurface, filename)
+        return subsurface
+
+    @classmethod
+    def preload_sheet(cls, filename, width, height):
+        """Cache every frame of a sprite sheet and its collision mask.
+
+        Args:
+            filename(string): Path of the sprite sheet image file.
+            width(int): Width of each frame.
+            height(int): Height of each frame.
+        """
+        for index in range(cls.load(filename).get_width() // width):
+            cls.frame_mask(filename, index, width, height)
+
+    @classmethod
+    def frame_mask(cls, filename, index, width, height):
+        """Return the shared collision mask for a frame of a sprite sheet.
+
+        Args:
+            filename(string): Path of the sprite sheet image file.
+            index(int): Zero based frame index from the left of the sheet.
+            width(int): Width of each frame.
+            height(int): Height of each frame.
+        """
+        key = (filename, index, width, height)
+        frame_mask = cls.masks.get(key)
+        if frame_mask is None:
+            frame_mask = mask.from_surface(
+                cls.frame(filename, index, width, height))
+            cls.masks[key] = frame_mask
+        return frame_mask
+
+    @classmethod
+    def image_mask(cls, filename):
+        """Return the shared collision mask for a whole image file.
+
+        Args:
+            filename(string): Path of the image file.
+        """
+        image_mask = cls.masks.get(filename)
+        if image_mask is None:
+            image_mask = mask.from_surface(cls.load(filename))
+            cls.masks[filename] = image_mask
+        return image_mask
+
+    @classmethod
+    def step_index(cls, angle):
+        """Return the index of the rotation step nearest to an angle.
+
+        Args:
+            angle(float): Counterclockwise rotation in degrees.
+        """
+        steps = round(360 / cls.rotation_step)
+        return round(angle / cls.rotation_step) % steps
+
+    @classmethod
+    def rotated(cls, surface, angle):
+        """Return a shared pre-rotated copy of a surface.
+
+        The angle is quantized to the rotation step and each orientation is
+        rotated when first drawn, so repeated draws become a dictionary
+        lookup.  Only the most recently drawn orientations are kept, so
+        spinning shrapnel does not fill memory with every orientation of
+        every fragment.
+
+        Args:
+            surface(pygame.Surface): Shared surface from the registry.
+            angle(float): Counterclockwise rotation in degrees.
+        """
+        index = cls.step_index(angle)
+        key = (surface, index)
+        rotated = cls.rotations.get(key)
+        if rotated is None:
+            if index == 0:  # Share the unrotated surface
+                rotated = surface
+            else:
+                rotated = transform.rotate(surface, index * cls.rotation_step)
+                if cls.audit:
+                    cls.audit.derived(rotated, surface, "rotated")
+            cls.rotations[key] = rotated
+            if len(cls.rotations) > ROTATION_CACHE_SIZE:
+                cls.rotations.popitem(last=False)  # Least recently used
+        else:
+            cls.rotations.move_to_end(key)
+        return rotated
+
+    @classmethod
+    def rotated_mask(cls, surface, angle):
+        """Return the shared collision mask of a pre-rotated surface.
+
+        Masks are built without keeping the rotated surface, which is only
+        needed once the orientation is drawn.
+
+        Args:
+            surface(pygame.Surface): Shared surface from the registry.
+            angle(float): Counterclockwise rotation in degrees.
+        """
+        index = cls.step_index(angle)
+        key = (surface, index)
+        rotated_mask = cls.rotated_masks.get(key)
+        if rotated_mask is None:
+            rotated = cls.rotations.get(key)
+            if rotated is None:
+                rotated = transform.rotate(surface, index * cls.rotation_step)
+                if cls.audit:
+                    cls.audit.derived(rotated, surface, "rotated")
+            rotated_mask = mask.from_surface(rotated)
+            cls.rotated_masks[key] = rotated_mask
+        return rotated_mask
+
+    @classmethod
+    def rotated_size(cls, size, angle):
+        """Return the width and height of a surface once rotated.
+
+        Args:
+            size((int, int)): Width and height of the unrotated surface.
+            angle(float): Counterclockwise rotation in degrees.
+        """
+        index = cls.step_index(angle)
+        key = (*size, index)
+        rotated_size = cls.rotated_sizes.get(key)
+        if rotated_size is None:  # Rotate a blank 8-bit surface to measure
+            rotated_size = transform.rotate(Surface(size, 0, 8),
+                                            index * cls.rotation_step
+                                            ).get_size()
+            cls.rotated_sizes[key] = rotated_size
+        return rotated_size
+
+    @classmethod
+    def prerotate_masks(cls, surface):
+        """Build the collision mask of every orientation of a surface.
+
+        Args:
+            surface(pygame.Surface): Shared surface from the registry.
+        """
+        for index in range(round(360 / cls.rotation_step)):
+            cls.rotated_mask(surface, index * cls.rotation_step)
+
+    @staticmethod
+    def scale(surface, size):
+        """Return a copy of a surface resized for another output resolution.
+
+        Enlarging keeps hard pixel edges and colorkeys exact, while shrinking
+        per-pixel alpha surfaces is smoothed.
+
+        Args:
+            surface(pygame.Surface): Surface to resize.
+            size((int, int)): Width and height of the copy.
+        """
+        width, height = surface.get_size()
+        if (surface.get_bitsize() == 32 and size[0] <= width and
+                size[1] <= height):
+            return transform.smoothscale(surface, size)
+        return transform.scale(surface, size)
+
+    @classmethod
+    def scale_atlas(cls, factor):
+        """Pre-scale each atlas page once for the output resolution.
+
+        Scaled pages are cached on disk as raw pixels, keyed by a hash of
+        the page and scaled size, so later runs skip the resize.
+
+        Args:
+            factor((float, float)): Horizontal and vertical scale factors.
+        """
+        for page in cls.atlas:
+            if page in cls.scaled:
+                continue
+            size = (round(page.get_width() * factor[0]),
+                    round(page.get_height() * factor[1]))
+            colorkey = page.get_colorkey() is not None
+            pixel_format = "RGB" if colorkey else "BGRA"
+            digest = sha1(image.tobytes(page, pixel_format))
+            digest.update(repr(size).encode())
+            cache_file = path.join(SCALE_FOLDER, digest.hexdigest() + ".raw")
+            try:
+                with open(cache_file, "rb") as raw_file:
+                    scaled = image.frombuffer(raw_file.read(), size,
+                                              pixel_format)
+            except (OSError, ValueError):  # Missing or invalid cache file
+                scaled = cls.scale(page, size)
+                try:
+                    makedirs(SCALE_FOLDER, exist_ok=True)
+                    with open(cache_file, "wb") as raw_file:
+                        raw_file.write(image.tobytes(scaled, pixel_format))
+                except OSError:
+                    pass  # Cache is optional, e.g. on a read-only file system
+            else:
+                if not colorkey:  # Display format, freeing the file buffer
+                    scaled = scaled.convert_alpha()
+            if colorkey:  # Restore 16-bit colorkeyed format
+                scaled = scaled.convert(16)
+                scaled.set_colorkey(COLORKEY)
+            cls.scaled[page] = scaled
+
+    @classmethod
+    def flip_atlas(cls):
+        """Rotate each atlas page, and each pre-scaled page, 180 degrees once.
+
+        Mirrored frames, such as those of a cocktail cabinet's player 2, are
+        drawn from subsurfaces of the flipped pages.
+        """
+        for page in cls.atlas + list(cls.scaled.values()):
+            if page not in cls.flipped:
+                cls.flipped[page] = transform.flip(page, True, True)
+
+    @classmethod
+    def surface_bytes(cls):
+        """Return total bytes of pixel memory held by the registry."""
+        roots = {}
+        for surface in (cls.atlas + list(cls.scaled.values()) +
+                        list(cls.flipped.values()) +
+                        list(cls.surfaces.values()) +
+                        list(cls.rotations.values())):
+            while surface.get_parent() is not None:  # Subsurfaces share
+                surface = surface.get_parent()
+            roots[id(surface)] = surface
+        return sum(surface.get_pitch() * surface.get_height()
+                   for surface in roots.values())
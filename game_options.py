@@ -1,7 +1,8 @@
 """Sabotage game options."""
-from game_fonts import GameFonts, Size
-from pygame import Color, draw, display, event, image, key, quit, Rect, Surface
-from pygame.locals import KEYDOWN, KEYUP, MOUSEMOTION, QUIT
+from game_fonts import Size
+from game_images import GameImages
+from pygame import Color, draw, key, Rect, Surface
+from pygame.locals import KEYDOWN, KEYUP, MOUSEMOTION
 
 TITLE = "images/title.png"
 MAX_PLAYERS = 2
@@ -10,7 +11,8 @@ MAX_PLAYERS = 2
 class Options:
     """Sabotage game options."""
 
-    def __init__(self, key_select, key_decrement, key_increment, key_exit):
+    def __init__(self, key_select, key_decrement, key_increment, key_exit,
+                 fonts):
         """Game options constructor.
 
         Args:
@@ -18,23 +20,28 @@ class Options:
             key_decrement(pygame.key): Keyboard key to increment value
             key_increment(pygame.key): Keyboard key to decrement value
             key_exit(pygame.key): Keyboard key to exit game
+            fonts(GameFonts): Shared game fonts
         """
         self.players = 1  # Number of players
         self.key_select = key_select
         self.key_decrement = key_decrement
         self.key_increment = key_increment
         self.key_exit = key_exit
-        self.title = image.load(TITLE)
+        self.title = GameImages.load(TITLE)
+        self.fonts = fonts
+        self.background = None  # Composed on first draw
+        self.input_value_pos = None
+        self.x_movement = 0  # Accumulated relative mouse X movement
 
-    def prompt(self, screen):
-        """Prompt for the number of players.
+    def compose(self, canvas):
+        """Compose everything but the input value onto one background.
 
         Args:
-            screen(pygame.Surface): Graphical window to display graphics.
+            canvas(Canvas): Game canvas
         """
-        fonts = GameFonts()
+        fonts = self.fonts
         input_text = "ENTER # OF PLAYERS"
-        screen_width, screen_height = screen.get_size()
+        screen_width, screen_height = canvas.get_size()
         play_area = Rect(int(screen_width * 0.15),
                          int(screen_height * 0.1),
                          int(screen_width * 0.70),
@@ -56,8 +63,7 @@ class Options:
         dir_pos = (play_area.centerx, play_area.bottom -
                    fonts.small.get_height())
 
-        # Create a new surface for the gradient
-        gradient_surface = Surface((screen_width, screen_height))
+        background = Surface((screen_width, screen_height)).convert()
         # Define the gradient colors
         colors = [Color("olivedrab"),
                   Color("olivedrab1"),
@@ -78,50 +84,60 @@ class Options:
                 color = [int(start * (1 - ratio) + end * ratio) for start,
                          end in zip(start_color, end_color)]
                 # Draw the line on the gradient surface
-                draw.line(gradient_surface, color, (0, i * trans_height + y),
+                draw.line(background, color, (0, i * trans_height + y),
                           (screen_width, i * trans_height + y))
-        x_movement = 0
-        while True:
-            for e in event.get():
-                if (e.type == QUIT or
-                        e.type == KEYDOWN and e.key == self.key_exit):
-                    quit()
-                    exit()
-                elif e.type == KEYDOWN:
-                    if e.key == self.key_decrement and self.players > 1:
-                        self.players -= 1
-                    elif (e.key == self.key_increment and
-                          self.players < MAX_PLAYERS):
-                        self.players += 1
-
-                elif e.type == MOUSEMOTION:
-                    # Check mouse X movement
-                    x_movement += e.rel[0]
-                    if x_movement > 25:
-                        self.players = 2
-                    elif x_movement < -25:
-                        self.players = 1
-                elif e.type == KEYUP:
-                    if e.key == self.key_select:
-                        return
-
-            # Blit the gradient surface onto the screen
-            screen.blit(gradient_surface, (0, 0))
-
-            draw.rect(screen, Color('darkgreen'), play_area, 0)  # Play area
-
-            # Sabotage title image
-            screen.blit(self.title, title_pos)
-            # Directions
-            fonts.draw(dir_text, Size.SMALL, dir_pos,
-                       screen, Color(76, 235, 0), center=True)
-            # Set input either players or games
-            input_value = self.players
-            # Draw input prompt and value
-            fonts.draw(input_text, Size.LARGE,
-                       (play_area.centerx, input_text_pos),
-                       screen, Color(226, 63, 0), center=True)
-            fonts.draw(str(input_value), Size.HUGE,
-                       (play_area.centerx, input_value_pos),
-                       screen, Color("white"), center=True)
-            display.flip()
+
+        draw.rect(background, Color('darkgreen'), play_area, 0)  # Play area
+
+        # Sabotage title image
+        background.blit(self.title, title_pos)
+        # Directions
+        fonts.draw(dir_text, Size.SMALL, dir_pos,
+                   background, Color(76, 235, 0), center=True)
+        # Draw input prompt
+        fonts.draw(input_text, Size.LARGE,
+                   (play_area.centerx, input_text_pos),
+                   background, Color(226, 63, 0), center=True)
+        self.background = background
+        self.input_value_pos = (play_area.centerx, input_value_pos)
+
+    def handle(self, events):
+        """Handle option input.
+
+        Args:
+            events([pygame.event.Event]): Events since the last frame
+        Returns:
+            bool: True once the select key is released
+        """
+        for e in events:
+            if e.type == KEYDOWN:
+                if e.key == self.key_decrement and self.players > 1:
+                    self.players -= 1
+                elif (e.key == self.key_increment and
+                      self.players < MAX_PLAYERS):
+                    self.players += 1
+
+            elif e.type == MOUSEMOTION:
+                # Check mouse X movement
+                self.x_movement += e.rel[0]
+                if self.x_movement > 25:
+                    self.players = 2
+                elif self.x_movement < -25:
+                    self.players = 1
+            elif e.type == KEYUP:
+                if e.key == self.key_select:
+                    return True
+        return False
+
+    def draw(self, canvas):
+        """Draw the options screen.
+
+        Args:
+            canvas(Canvas): Game canvas
+        """
+        if self.background is None:
+            self.compose(canvas)
+        canvas.begin(self.background)
+        # Draw input value
+        self.fonts.draw(str(self.players), Size.HUGE, self.input_value_pos,
+                        canvas, Color("white"), center=True)
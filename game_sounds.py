@@ -1,8 +1,12 @@
 """Game sounds."""
+from hashlib import sha1
+import json
 from pygame import mixer, USEREVENT
-from os import path
+from os import makedirs, path
 
 END_SOUND_EVENT = USEREVENT + 1
+SOUND_FOLDER = "sounds"
+CACHE_FOLDER = path.join("cache", "sounds")  # Decoded PCM sound effects
 
 SOUND_EFFECTS = ['bomb', 'destroy', 'explode', 'fall', 'fire', 'helicopter',
                  'jet_lr', 'jet_rl', 'parachute', 'shot', 'splat']
@@ -11,11 +15,14 @@ SOUND_EFFECTS = ['bomb', 'destroy', 'explode', 'fall', 'fire', 'helicopter',
 class GameSounds():
     """Generates, loads and plays sounds."""
 
-    def __init__(self, volume=1.0):
+    instance = None  # Process-wide shared sounds
+
+    def __init__(self, volume=1.0, bundle=None):
         """Game sounds constructor.
 
         Args:
             volume(float): Volume 0 - 1.0 (Default 1.0)
+            bundle(AssetBundle): Optional bundle of pre-decoded sounds
         """
         mixer.init()
         mixer.set_num_channels(16)
@@ -23,7 +30,18 @@ class GameSounds():
         self.volume = volume
         self.sound_effects = {}
         self.used_channels = set()
-        self.load_sound_effects()
+        self.load_sound_effects(bundle)
+
+    @classmethod
+    def shared(cls, bundle=None):
+        """Return the process-wide sounds, initializing the mixer once.
+
+        Args:
+            bundle(AssetBundle): Optional bundle of pre-decoded sounds
+        """
+        if cls.instance is None:
+            cls.instance = cls(bundle=bundle)
+        return cls.instance
 
     def clean_up_channels(self):
         """Clean up any finished channels."""
@@ -31,11 +49,74 @@ class GameSounds():
             if not channel.get_busy():
                 self.used_channels.remove(channel)
 
-    def load_sound_effects(self):
-        """Load all game sound effects."""
+    def load_sound_effects(self, bundle=None):
+        """Load all game sound effects.
+
+        Args:
+            bundle(AssetBundle): Optional bundle of pre-decoded sounds
+        """
         for effect in SOUND_EFFECTS:
-            self.sound_effects[effect] = mixer.Sound(path.join("sounds",
-                                                     effect + ".mp3"))
+            sound = bundle.sound(effect) if bundle else None
+            if sound is None:  # Use cached PCM if not bundled
+                sound = self.load_cached(effect)
+            self.sound_effects[effect] = sound
+
+    def load_cached(self, effect):
+        """Load a sound effect from the PCM cache, decoding it on a miss.
+
+        Cached PCM is only used if it matches the mixer's frequency, format
+        and channels, and the source file's modification time or hash.
+
+        Args:
+            effect(string): Effect to load.
+        """
+        source = path.join(SOUND_FOLDER, effect + ".mp3")
+        frequency, size, channels = mixer.get_init()
+        cache_file = path.join(CACHE_FOLDER,
+                               f"{effect}-{frequency}-{size}-{channels}.pcm")
+        mtime = path.getmtime(source)
+        digest = None
+        try:
+            with open(cache_file, "rb") as pcm_file:
+                header = json.loads(pcm_file.readline())
+                if header["mtime"] == mtime:
+                    return mixer.Sound(buffer=pcm_file.read())
+                # Modification time changed, compare contents instead
+                with open(source, "rb") as source_file:
+                    digest = sha1(source_file.read()).hexdigest()
+                if header["sha1"] == digest:
+                    raw = pcm_file.read()
+                    # Record the new time so later runs skip the hash
+                    self.write_cached(cache_file, mtime, digest, raw)
+                    return mixer.Sound(buffer=raw)
+        except (OSError, ValueError, KeyError):
+            pass  # Missing or invalid cache file
+
+        sound = mixer.Sound(source)
+        if digest is None:
+            with open(source, "rb") as source_file:
+                digest = sha1(source_file.read()).hexdigest()
+        self.write_cached(cache_file, mtime, digest, sound.get_raw())
+        return sound
+
+    @staticmethod
+    def write_cached(cache_file, mtime, digest, raw):
+        """Write PCM to the cache, ignoring failures.
+
+        Args:
+            cache_file(string): Path of the cache file.
+            mtime(float): Modification time of the source file.
+            digest(string): SHA-1 of the source file.
+            raw(bytes): PCM in the mixer format.
+        """
+        try:
+            makedirs(CACHE_FOLDER, exist_ok=True)
+            with open(cache_file, "wb") as pcm_file:
+                pcm_file.write(json.dumps({"mtime": mtime,
+                                           "sha1": digest}).encode() + b"\n")
+                pcm_file.write(raw)
+        except OSError:
+            pass  # Cache is optional, e.g. on a read-only file system
 
     def loop_playing(self, effect):
         """Return if looped sound effect playing.
@@ -81,12 +162,11 @@ class GameSounds():
                     channel.fadeout(500)
                     self.used_channels.remove(channel)
 
-    def play(self, effects, pause=False):
+    def play(self, effects):
         """Play sound effect(s).
 
         Args:
             effects(string or [string]): Effect(s) to play.
-            pause(bool): True to pause until sound is played
         """
         if isinstance(effects, str):  # Handle single effect
             effects = [effects]
@@ -98,6 +178,3 @@ class GameSounds():
             self.used_channels.add(channel)
             channel.play(self.sound_effects[effect])
             channel.set_endevent(END_SOUND_EVENT)
-            if pause:
-                while channel.get_busy():
-                    continue
@@ -0,0 +1,75 @@
+"""Idle frame governor."""
+from pygame import event
+from pygame.locals import (
+    NOEVENT, WINDOWEXPOSED, WINDOWFOCUSGAINED, WINDOWFOCUSLOST,
+    WINDOWMINIMIZED, WINDOWRESTORED)
+
+IDLE_TIMEOUT = 100  # Longest wait for events when not animating (ms)
+
+
+class Governor:
+    """Paces the main loop to what the current scene needs.
+
+    Animating scenes run at the full frame rate.  Static scenes such as
+    menus and banners block on event.wait and are only redrawn when input
+    changes something or the window needs repainting.  While the window is
+    unfocused or minimized every scene waits on events, so the loop drops
+    to about 1000 / IDLE_TIMEOUT frames per second, and nothing is drawn
+    while minimized.
+    """
+
+    def __init__(self, clock, fps):
+        """Governor constructor.
+
+        Args:
+            clock(FramePacer): Game clock
+            fps(int): Frame rate of animating scenes
+        """
+        self.clock = clock
+        self.fps = fps
+        self.focused = True
+        self.minimized = False
+        self.exposed = True  # Window needs a full repaint
+
+    def wait(self, scene):
+        """Wait for the next frame.
+
+        Args:
+            scene(Scene): Current scene
+        Returns:
+            [pygame.event.Event]: Events since the last frame
+        """
+        if scene.animating and self.focused and not self.minimized:
+            self.clock.tick(self.fps)
+            events = event.get()
+        else:
+            timeout = scene.timeout()
+            if timeout is None or timeout > IDLE_TIMEOUT:
+                timeout = IDLE_TIMEOUT
+            first = event.wait(max(timeout, 1))
+            events = [] if first.type == NOEVENT else [first]
+            events += event.get()
+            self.clock.tick()  # Keep frame times current without waiting
+        for e in events:
+            if e.type == WINDOWFOCUSLOST:
+                self.focused = False
+            elif e.type == WINDOWFOCUSGAINED:
+                self.focused = True
+            elif e.type == WINDOWMINIMIZED:
+                self.minimized = True
+            elif e.type == WINDOWRESTORED:
+                self.minimized = False
+                self.exposed = True
+            elif e.type == WINDOWEXPOSED:
+                self.exposed = True
+        return events
+
+    def should_draw(self, scene):
+        """Return True if the scene needs drawing this frame.
+
+        Args:
+            scene(Scene): Current scene
+        """
+        if self.minimized:
+            return False
+        return scene.animating or scene.changed or self.exposed
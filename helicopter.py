@@ -1,14 +1,19 @@
 """Helicopter."""
 from math import copysign
-from pygame import image, mask, Rect, sprite, Vector2, time
+from game_images import GameImages
+from motion import MovingSprite
+from pygame import Vector2
 
 CHOPPER = "images/helicopter.png"
 BAND_HEIGHT = 70  # Height of each flight band level
+BLADE_STEPS = 6  # Simulation steps between blade frames (100 ms)
 
 
-class Helicopter(sprite.Sprite):
+class Helicopter(MovingSprite):
     """Helicopter."""
 
+    templates = {}  # Key=direction, value=([images], [masks])
+
     def __init__(self, screen_width, drops, direction_x, flight_level):
         """Initialize helicopter.
 
@@ -24,34 +29,26 @@ class Helicopter(sprite.Sprite):
         # Order drop zones
         self.drops = sorted(drops, reverse=copysign(1, direction_x) < 0)
 
-        # Split the sprite sheet into individual images.
-        sprite_sheet = image.load(CHOPPER)
-        self.sprite_width = sprite_sheet.get_width() // 4
-        self.sprite_height = sprite_sheet.get_height()
-        self.sprites = [
-            sprite_sheet.subsurface(Rect(i * self.sprite_width, 0,
-                                         self.sprite_width,
-                                         self.sprite_height))
-            for i in range(4)
-        ]
+        # Blade animation frames facing the direction of flight
+        self.sprites, self.masks = self.template(1 if direction_x > 0 else -1)
+        self.sprite_width, self.sprite_height = self.sprites[0].get_size()
 
         self.direction = Vector2(direction_x, 0)
         if direction_x > 0:  # Left to right
             self.location = Vector2(
                 5 - self.sprite_width // 2,
                 (flight_level + 1) * BAND_HEIGHT)
-            self.image = self.sprites[0]  # Initial sprite facing left
         else:  # Right to left
             self.location = Vector2(
                 (self.screen_width - 5) + self.sprite_width // 2,
                 (flight_level + 1) * BAND_HEIGHT)
-            self.image = self.sprites[2]  # Initial sprite facing right
+        self.image = self.sprites[0]
+        self.mask = self.masks[0]
         self.rect = self.image.get_rect()
         # Set initial position - aligned bottom center
         self.rect.midbottom = self.location
-        self.mask = mask.from_surface(self.image)
         # Used for sprite alternation
-        self.last_update_time = time.get_ticks()
+        self.animation_count = 0
         self.current_sprite_index = 0
 
     @property
@@ -59,13 +56,45 @@ class Helicopter(sprite.Sprite):
         """Return current direction and flight level."""
         return (1 if self.direction.x > 0 else -1, self.flight_level)
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """Draw helicopter.
 
         Args:
             screen(pygame.Surface): Graphical window to display graphics.
+            alpha(float): Fraction of the last simulation step to show
+        """
+        screen.blit(self.image, self.interpolate(alpha))
+
+    @classmethod
+    def preload(cls):
+        """Build helicopter templates for both directions."""
+        for direction in (1, -1):
+            cls.template(direction)
+
+    @classmethod
+    def template(cls, direction):
+        """Return the shared spawn template for a direction of flight.
+
+        Args:
+            direction(int): 1=Left to right, -1=Right to left
+        Returns:
+            ([pygame.Surface], [pygame.mask.Mask]): Blade animation frames
+                and masks
         """
-        screen.blit(self.image, self.rect)
+        template = cls.templates.get(direction)
+        if template is None:
+            sprite_sheet = GameImages.load(CHOPPER)
+            width = sprite_sheet.get_width() // 4
+            height = sprite_sheet.get_height()
+            # Frames 0 & 1 face left to right, frames 2 & 3 right to left
+            first = 0 if direction > 0 else 2
+            template = (
+                [GameImages.frame(CHOPPER, i, width, height)
+                 for i in (first, first + 1)],
+                [GameImages.frame_mask(CHOPPER, i, width, height)
+                 for i in (first, first + 1)])
+            cls.templates[direction] = template
+        return template
 
     @property
     def out_of_bounds(self):
@@ -91,18 +120,14 @@ class Helicopter(sprite.Sprite):
         self.rect.midbottom = self.location
 
         # Update the sprite based on direction
-        now = time.get_ticks()
-        if now - self.last_update_time > 100:  # 100 ms passed
-            self.last_update_time = now
+        self.animation_count += 1
+        if self.animation_count >= BLADE_STEPS:
+            self.animation_count = 0
             # Animate helicopter blades
-            if self.direction.x > 0:
-                self.current_sprite_index = (
-                    0 if self.current_sprite_index == 1 else 1)
-            elif self.direction.x < 0:
-                self.current_sprite_index = (
-                    2 if self.current_sprite_index == 3 else 3)
+            self.current_sprite_index = (
+                0 if self.current_sprite_index == 1 else 1)
             self.image = self.sprites[self.current_sprite_index]
-            self.mask = mask.from_surface(self.image)
+            self.mask = self.masks[self.current_sprite_index]
 
         # Check for drop zone
         if len(self.drops):
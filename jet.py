@@ -1,5 +1,7 @@
 """Jet."""
-from pygame import image, mask, Rect, sprite, Vector2
+from game_images import GameImages
+from motion import MovingSprite
+from pygame import Vector2
 from random import random, randint
 
 JET = "images/jet.png"
@@ -15,9 +17,11 @@ HORIZ_RANGE = {  # Bomb trajectory speed to X distance
 }
 
 
-class Jet(sprite.Sprite):
+class Jet(MovingSprite):
     """Jet."""
 
+    templates = {}  # Key=direction, value=(image, mask)
+
     def __init__(self, screen_width, direction_x, flight_level, bunker_rect):
         """Initialize jet.
 
@@ -31,28 +35,19 @@ class Jet(sprite.Sprite):
         self.screen_width = screen_width
         self.flight_level = flight_level
 
-        # Split the sprite sheet into individual images.
-        sprite_sheet = image.load(JET).convert_alpha()
-        self.sprite_width = sprite_sheet.get_width() // 2
-        self.sprite_height = sprite_sheet.get_height()
-        self.sprites = [
-            sprite_sheet.subsurface(Rect(i * self.sprite_width, 0,
-                                         self.sprite_width,
-                                         self.sprite_height))
-            for i in range(2)
-        ]
+        # Sprite facing the direction of flight
+        self.image, self.mask = self.template(1 if direction_x > 0 else -1)
+        self.sprite_width, self.sprite_height = self.image.get_size()
 
         self.direction = Vector2(direction_x, 0)
         if direction_x > 0:  # Left to right
             self.location = Vector2(
                 5 - self.sprite_width // 2,
                 (flight_level + 1) * BAND_HEIGHT)
-            self.image = self.sprites[0]  # Initial sprite facing left
         else:  # Right to left
             self.location = Vector2(
                 (self.screen_width - 5) + self.sprite_width // 2,
                 (flight_level + 1) * BAND_HEIGHT)
-            self.image = self.sprites[1]  # Initial sprite facing right
 
         if random() < .25:  # 25% of jets don't drop bombs
             self.bombs = 0
@@ -68,20 +63,46 @@ class Jet(sprite.Sprite):
         self.rect = self.image.get_rect()
         # Set initial position - aligned bottom center
         self.rect.midbottom = self.location
-        self.mask = mask.from_surface(self.image)
 
     @property
     def course(self):
         """Return current direction and flight level."""
         return (1 if self.direction.x > 0 else -1, self.flight_level)
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """Draw jet.
 
         Args:
             screen(pygame.Surface): Graphical window to display graphics.
+            alpha(float): Fraction of the last simulation step to show
+        """
+        screen.blit(self.image, self.interpolate(alpha))
+
+    @classmethod
+    def preload(cls):
+        """Build jet templates for both directions."""
+        for direction in (1, -1):
+            cls.template(direction)
+
+    @classmethod
+    def template(cls, direction):
+        """Return the shared spawn template for a direction of flight.
+
+        Args:
+            direction(int): 1=Left to right, -1=Right to left
+        Returns:
+            (pygame.Surface, pygame.mask.Mask): Jet image and mask
         """
-        screen.blit(self.image, self.rect)
+        template = cls.templates.get(direction)
+        if template is None:
+            sprite_sheet = GameImages.load(JET)
+            width = sprite_sheet.get_width() // 2
+            height = sprite_sheet.get_height()
+            index = 0 if direction > 0 else 1
+            template = (GameImages.frame(JET, index, width, height),
+                        GameImages.frame_mask(JET, index, width, height))
+            cls.templates[direction] = template
+        return template
 
     @property
     def out_of_bounds(self):
@@ -0,0 +1,38 @@
+"""Moving sprites."""
+from pygame import sprite
+
+
+class MovingSprite(sprite.Sprite):
+    """Sprite drawn between its positions at the last two simulation steps.
+
+    The game saves the rect of every moving sprite before each simulation
+    step.  Drawing it part of the way from the saved rect to the current one
+    keeps motion smooth when frames are not in step with the simulation.
+    """
+
+    previous = None  # Rect before the last simulation step
+
+    def save_position(self):
+        """Save the rect before a simulation step."""
+        self.previous = self.rect.copy()
+
+    def interpolate(self, alpha):
+        """Return the rect part of the way through the last step.
+
+        The center moves between the two rects, so sprites whose size
+        changes with their frame, such as rotating bombs, do not wobble.
+
+        Args:
+            alpha(float): 0=Previous rect, 1=Current rect
+        Returns:
+            pygame.Rect: Rect to draw the sprite at (do not modify)
+        """
+        previous, rect = self.previous, self.rect
+        if previous is None or alpha >= 1:
+            return rect
+        beta = 1 - alpha
+        x, y = rect.center
+        interpolated = rect.copy()
+        interpolated.center = (round(x + (previous.centerx - x) * beta),
+                               round(y + (previous.centery - y) * beta))
+        return interpolated
@@ -0,0 +1,114 @@
+"""Frame pacer."""
+import atexit
+from collections import deque
+from pygame import time
+from time import perf_counter, sleep
+
+CLOCK = "clock"  # pygame Clock.tick
+HYBRID = "hybrid"  # Sleep, then spin until the frame is due
+VSYNC = "vsync"  # Presenting the frame waits for the display refresh
+SPIN_WINDOW = 2  # Milliseconds before each frame to spin instead of sleep
+FPS_FRAMES = 10  # Frames averaged by get_fps, as Clock does
+STATS_FRAMES = 600  # Frames included in jitter statistics
+REPORT_INTERVAL = 10  # Seconds between periodic reports
+
+
+class FramePacer:
+    """Paces frames in place of a pygame Clock, with the same tick API.
+
+    Clock.tick sleeps in whole milliseconds and may wake late, so frame
+    times are uneven.  Hybrid pacing sleeps until shortly before a frame is
+    due, then spins on a high resolution timer for the rest.  Vsync pacing
+    does not wait at all, leaving the display refresh to pace frames.
+
+    The intervals between paced frames are kept so their jitter can be
+    reported.
+    """
+
+    def __init__(self, mode=CLOCK, spin_window=SPIN_WINDOW, report=False):
+        """Frame pacer constructor.
+
+        Args:
+            mode(string): Pacing (clock, hybrid or vsync). (default=clock)
+            spin_window(float): Milliseconds to spin before each frame.
+                (default=2)
+            report(bool): Print jitter statistics periodically and at exit.
+                (default=False)
+        """
+        if mode not in (CLOCK, HYBRID, VSYNC):
+            raise ValueError("Invalid frame pacing.")
+        self.mode = mode
+        self.spin_window = spin_window / 1000
+        self.clock = time.Clock()
+        self.last = perf_counter()  # Time of the last tick
+        self.interval = 0.0  # Seconds between the last two ticks
+        self.recent = deque(maxlen=FPS_FRAMES)
+        self.intervals = deque(maxlen=STATS_FRAMES)  # Paced frames only
+        self.last_report = self.last if report else None
+        if report:
+            atexit.register(self.report)
+
+    def tick(self, framerate=0):
+        """Wait until the next frame is due.
+
+        Args:
+            framerate(int): Frames per second, 0 to not wait. (default=0)
+        Returns:
+            int: Milliseconds since the previous tick
+        """
+        if self.mode == CLOCK:
+            self.clock.tick(framerate)
+        elif framerate and self.mode == HYBRID:
+            due = self.last + 1 / framerate
+            nap = due - perf_counter() - self.spin_window
+            if nap > 0:
+                sleep(nap)
+            while perf_counter() < due:
+                pass
+        now = perf_counter()
+        self.interval = now - self.last
+        self.last = now
+        self.recent.append(self.interval)
+        if framerate:  # Waits for events are not frames to pace
+            self.intervals.append(self.interval)
+        if (self.last_report is not None and
+                now - self.last_report >= REPORT_INTERVAL):
+            self.report()
+        return self.get_time()
+
+    def get_time(self):
+        """Return milliseconds between the previous two ticks."""
+        return int(self.interval * 1000)
+
+    def get_fps(self):
+        """Return frames per second averaged over the last few ticks."""
+        if not self.recent:
+            return 0.0
+        return len(self.recent) / sum(self.recent)
+
+    def stats(self):
+        """Return frame interval statistics of recent paced frames.
+
+        Returns:
+            (float, float, float, float): Mean, 95th percentile, 99th
+                percentile and maximum interval (milliseconds), or None if
+                no frames were paced.
+        """
+        if not self.intervals:
+            return None
+        intervals = sorted(self.intervals)
+        count = len(intervals)
+        return (sum(intervals) * 1000 / count,
+                intervals[int(count * .95)] * 1000,
+                intervals[int(count * .99)] * 1000,
+                intervals[-1] * 1000)
+
+    def report(self):
+        """Print frame interval statistics."""
+        self.last_report = perf_counter()
+        stats = self.stats()
+        if stats is None:
+            return
+        print(f"Frame pacing {self.mode}: mean {stats[0]:.2f} ms, "
+              f"p95 {stats[1]:.2f} ms, p99 {stats[2]:.2f} ms, "
+              f"max {stats[3]:.2f} ms")
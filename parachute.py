@@ -1,10 +1,11 @@
 """Parachute."""
-from pygame import image, mask, sprite
+from game_images import GameImages
+from motion import MovingSprite
 
 PARACHUTE = "images/parachute.png"
 
 
-class Parachute(sprite.Sprite):
+class Parachute(MovingSprite):
     """Parachute."""
 
     def __init__(self, location):
@@ -14,17 +15,23 @@ class Parachute(sprite.Sprite):
             location(Vector2) Starting X,Y midbottom of parachute
         """
         super().__init__()
-        self.image = image.load(PARACHUTE).convert_alpha()
-        self.mask = mask.from_surface(self.image)
+        self.image = GameImages.load(PARACHUTE)
+        self.mask = GameImages.image_mask(PARACHUTE)
         self.rect = self.image.get_rect(midbottom=location)
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """Draw parachute.
 
         Args:
             screen(pygame.Surface): Graphical window to display graphics.
+            alpha(float): Fraction of the last simulation step to show
         """
-        screen.blit(self.image, self.rect)
+        screen.blit(self.image, self.interpolate(alpha))
+
+    @staticmethod
+    def preload():
+        """Cache parachute image and mask."""
+        GameImages.image_mask(PARACHUTE)
 
     def update(self, location):
         """Update position of the parachute.
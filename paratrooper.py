@@ -1,6 +1,8 @@
 """Paratrooper."""
 from parachute import Parachute
-from pygame import image, mask, Rect, sprite, Vector2, time
+from game_images import GameImages
+from motion import MovingSprite
+from pygame import Vector2
 from random import choice
 from enum import Enum
 
@@ -12,6 +14,8 @@ PARATROOPERS = "images/paratrooper.png"
 WIDTH = 27
 HEIGHT = 52
 CROUCHED_SIZE = (27, 37)
+ANIMATION_STEPS = 6  # Simulation steps between falling frames (100 ms)
+WALK_STEPS = 12  # Demolition walk steps between frames (100 ms)
 
 
 class Status(Enum):
@@ -33,9 +37,11 @@ class Landing(Enum):
     DEAD = 4
 
 
-class Paratrooper(sprite.Sprite):
+class Paratrooper(MovingSprite):
     """Paratrooper."""
 
+    templates = {}  # Key=sprite index, value=([images], [masks])
+
     def __init__(self, drop_zone_x, over_bunker, flight_level,
                  max_flight_level, ground_y, bunker_y):
         """Initialize Paratrooper.
@@ -49,7 +55,6 @@ class Paratrooper(sprite.Sprite):
             bunker_y(int): Y coordinate of bunker roof
         """
         super().__init__()
-        self.sprite_sheet = image.load(PARATROOPERS).convert_alpha()
         self.ground_y = ground_y
         self.bunker_y = bunker_y
         if over_bunker:
@@ -57,35 +62,59 @@ class Paratrooper(sprite.Sprite):
         else:
             self.current_sprite_index = choice((0, 2))  # Airborne infantry
         self.over_bunker = over_bunker
-        source_rect = Rect(self.current_sprite_index * WIDTH, 0, WIDTH, HEIGHT)
-        self.image = self.sprite_sheet.subsurface(source_rect)
-        self.mask = mask.from_surface(self.image)
+        images, masks = self.template(self.current_sprite_index)
+        self.image = images[0]
+        self.mask = masks[0]
         starting_location = Vector2(drop_zone_x,
                                     (flight_level + 1) * BAND_HEIGHT)
         self.rect = self.image.get_rect(midtop=starting_location)
         self.direction = Vector2(0, 1)
         self.state = Status.FREE_FALL
         self.deployment_y = (max_flight_level + 1) * BAND_HEIGHT + 103
-        self.chute = Parachute(location=self.rect.midtop)
+        self.chute = None  # Created when deployed
         # Used for sprite alternation
-        self.last_update_time = time.get_ticks()
+        self.animation_count = 0
         self.index_adjust = 0
 
     def crouch(self):
         """Set sprite to crouch position."""
-        source_rect = Rect(6 * WIDTH, 0, WIDTH, HEIGHT)
-        self.image = self.sprite_sheet.subsurface(source_rect)
-        self.mask = mask.from_surface(self.image)
+        self.set_frame(6)
+
+    @classmethod
+    def preload(cls):
+        """Build paratrooper templates and cache parachute image and mask."""
+        GameImages.preload_sheet(PARATROOPERS, WIDTH, HEIGHT)
+        for index in (0, 2, 4):
+            cls.template(index)
+        Parachute.preload()
+
+    @classmethod
+    def template(cls, index):
+        """Return the shared spawn template for a paratrooper variant.
 
-    def draw(self, screen):
-        """Draw Paratrooper.
+        Args:
+            index(int): Sprite index (0 & 2=Airborne infantry, 4=Demolition)
+        Returns:
+            ([pygame.Surface], [pygame.mask.Mask]): Animation frames and masks
+        """
+        template = cls.templates.get(index)
+        if template is None:
+            template = (
+                [GameImages.frame(PARATROOPERS, i, WIDTH, HEIGHT)
+                 for i in (index, index + 1)],
+                [GameImages.frame_mask(PARATROOPERS, i, WIDTH, HEIGHT)
+                 for i in (index, index + 1)])
+            cls.templates[index] = template
+        return template
+
+    def draw(self, screen, alpha=1.0):
+        """Draw Paratrooper, without its parachute.
 
         Args:
             screen(pygame.Surface): Graphical window to display graphics.
+            alpha(float): Fraction of the last simulation step to show
         """
-        if self.state == Status.CHUTE_DEPLOYED:  # Draw parachute
-            self.chute.draw(screen)
-        screen.blit(self.image, self.rect)
+        screen.blit(self.image, self.interpolate(alpha))
 
     @property
     def on_ground(self):
@@ -97,6 +126,21 @@ class Paratrooper(sprite.Sprite):
         """Return if paratrooper is falling with chute deployed."""
         return self.state == Status.CHUTE_DEPLOYED
 
+    def set_frame(self, index):
+        """Set sprite image and collision mask to a sprite sheet frame.
+
+        Args:
+            index(int): Zero based frame index of the paratrooper sheet
+        """
+        self.image = GameImages.frame(PARATROOPERS, index, WIDTH, HEIGHT)
+        self.mask = GameImages.frame_mask(PARATROOPERS, index, WIDTH, HEIGHT)
+
+    def save_position(self):
+        """Save the rect, and the parachute's, before a simulation step."""
+        super().save_position()
+        if self.chute:
+            self.chute.save_position()
+
     def sever_parachute(self):
         """Sever parachute."""
         if self.state == Status.CHUTE_DEPLOYED:
@@ -113,19 +157,17 @@ class Paratrooper(sprite.Sprite):
                 self.direction.y += GRAVITY   # Simulate gravity
                 if self.rect.y >= self.deployment_y:
                     self.state = Status.CHUTE_DEPLOYED
+                    self.chute = Parachute(location=self.rect.midtop)
             elif self.state == Status.CHUTE_SEVERED:
                 self.direction.y += GRAVITY   # Simulate gravity
                 # Falling animiation
-                now = time.get_ticks()
-                if now - self.last_update_time > 100:  # 100 ms passed
-                    self.last_update_time = now
+                self.animation_count += 1
+                if self.animation_count >= ANIMATION_STEPS:
+                    self.animation_count = 0
                     self.index_adjust = (
                         0 if self.index_adjust == 1 else 1)
-                    source_rect = Rect((self.current_sprite_index +
-                                        self.index_adjust) * WIDTH, 0,
-                                       WIDTH, HEIGHT)
-                    self.image = self.sprite_sheet.subsurface(source_rect)
-                    self.mask = mask.from_surface(self.image)
+                    self.set_frame(self.current_sprite_index +
+                                   self.index_adjust)
             elif self.state == Status.CHUTE_DEPLOYED:
                 if self.direction.y > CANOPY_DESCENT:
                     self.direction.y -= 0.4
@@ -150,9 +192,7 @@ class Paratrooper(sprite.Sprite):
                     # Safe landing
                     self.rect.bottom = self.ground_y
                     self.state = Status.LANDED
-                    source_rect = Rect(6 * WIDTH, 0, WIDTH, HEIGHT)
-                    self.image = self.sprite_sheet.subsurface(source_rect)
-                    self.mask = mask.from_surface(self.image)
+                    self.crouch()
                     return Landing.ON_GROUND
                 else:
                     self.state = Status.DEAD
@@ -166,12 +206,9 @@ class Paratrooper(sprite.Sprite):
             dir([int, int]): Direction and speed to walk
         """
         self.rect.move_ip(dir)
-        now = time.get_ticks()
-        if now - self.last_update_time > 100:  # 100 ms passed
-            self.last_update_time = now
+        self.animation_count += 1
+        if self.animation_count >= WALK_STEPS:
+            self.animation_count = 0
             self.index_adjust = (
                 0 if self.index_adjust == 1 else 1)
-            source_rect = Rect((self.current_sprite_index +
-                               self.index_adjust) * WIDTH, 0,
-                               WIDTH, HEIGHT)
-            self.image = self.sprite_sheet.subsurface(source_rect)
+            self.set_frame(self.current_sprite_index + self.index_adjust)
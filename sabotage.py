@@ -1,20 +1,34 @@
 """Pygame Sabotage."""
+from asset_bundle import AssetBundle
+from blit_audit import BlitAudit
 from bomb import Bomb
 from bullet import Bullet
+from canvas import Canvas, Layer, SURFACE, TEXTURE, TextureCanvas
 from configparser import ConfigParser
 from enum import Enum
 from explosion import Explosion
 from game_board import Board
+from game_fonts import GameFonts
+from game_images import GameImages, LOW_MEMORY, STANDARD
 from game_options import Options
 from game_sounds import GameSounds, END_SOUND_EVENT
 import gc
+from governor import Governor
 from helicopter import Helicopter
 from jet import Jet
 from paratrooper import CROUCHED_SIZE, Paratrooper, Landing, Status
-from pygame import display, event, init, mouse, quit, sprite, time, transform
-from pygame.locals import FULLSCREEN, KEYDOWN, MOUSEMOTION, QUIT
+from pacer import FramePacer, HYBRID, VSYNC
+from pygame import display, error, init, mouse, quit, sprite
+from pygame.locals import (
+    FULLSCREEN, HIDDEN, KEYDOWN, MOUSEMOTION, QUIT, SCALED)
+from os import environ
 from random import randint
+from scenes import (
+    DemolitionScene, GameOverScene, OptionsScene, WaveBannerScene)
 from sys import exit, modules
+from threading import Thread
+from timeline import Timeline
+from timestep import FixedStep, STEP_RATE
 from turret import Turret
 from waves import Waves
 from zones import Zones
@@ -40,18 +54,40 @@ class Game:
     def __init__(self):
         """Game constructor."""
         init()  # Initialize pygame library
-        self.clock = time.Clock()
         # Load game settings file
         config = ConfigParser()
         config.read('settings.ini')
         self.screen_width = config.getint('GameSettings', 'screen_width')
         self.screen_height = config.getint('GameSettings', 'screen_height')
         full_screen = config.getboolean('GameSettings', 'full_screen')
-        self.fps = config.getint('GameSettings', 'speed')
+        output_size = (config.getint('GameSettings', 'output_width'),
+                       config.getint('GameSettings', 'output_height'))
+        if not all(output_size):  # Output at the logical screen resolution
+            output_size = None
+        self.fps = config.getint('GameSettings', 'speed')  # Frame rate
+        self.timestep = FixedStep()  # Simulation runs at STEP_RATE
         self.total_lives = config.getint('GameSettings', 'lives')
         self.mouse_rel = config.getboolean('GameSettings', 'mouse_relative')
         self.show_fps = config.getboolean('GameSettings', 'frame_rate')
         self.cocktail = config.getboolean('GameSettings', 'cocktail_mode')
+        dirty_rects = config.getboolean('GameSettings', 'dirty_rects')
+        renderer = config.get('GameSettings', 'renderer')
+        if renderer not in (SURFACE, TEXTURE):
+            raise ValueError("Invalid renderer.")
+        blit_audit = config.getboolean('GameSettings', 'blit_audit')
+        self.clock = FramePacer(
+            config.get('GameSettings', 'frame_pacing'),
+            config.getfloat('GameSettings', 'spin_window'),
+            config.getboolean('GameSettings', 'pacing_stats'))
+        self.governor = Governor(self.clock, self.fps)
+        vsync = self.clock.mode == VSYNC
+        GameImages.rotation_step = config.getint('GameSettings',
+                                                 'rotation_step')
+        if GameImages.rotation_step <= 0:
+            raise ValueError("Invalid rotation step.")
+        GameImages.profile = config.get('GameSettings', 'asset_profile')
+        if GameImages.profile not in (STANDARD, LOW_MEMORY):
+            raise ValueError("Invalid asset profile.")
 
         # Get keyboard input keys for each player
         self.input_keys = {}
@@ -71,22 +107,58 @@ class Game:
         self.key_exit = getattr(modules["pygame"],
                                 config.get("Player1", "exit_key"))
         # Initialize screen
-        if full_screen:
-            self.screen = display.set_mode((0, 0), FULLSCREEN)
+        size = (self.screen_width, self.screen_height)  # Logical size
+        if renderer == TEXTURE:
+            if blit_audit:  # Copy textures immediately so each is timed
+                environ["SDL_RENDER_BATCHING"] = "0"
+            # Hidden display surface only sets the format for conversions
+            self.screen = display.set_mode((1, 1), HIDDEN)
+            self.canvas = TextureCanvas(size, output_size, full_screen, vsync)
         else:
-            self.screen = display.set_mode((self.screen_width,
-                                            self.screen_height))
-
-        self.board = Board(self.screen_width, self.screen_height,
-                           self.key_select,
-                           self.key_exit)
+            self.screen = None
+            if vsync:
+                # Only windows drawn by an SDL renderer wait for vsync
+                flags = SCALED | (FULLSCREEN if full_screen else 0)
+                try:
+                    self.screen = display.set_mode(output_size or size,
+                                                   flags, vsync=1)
+                except error:
+                    print("Vsync unavailable, using hybrid frame pacing")
+                    self.clock.mode = HYBRID
+            if self.screen is None and full_screen:
+                self.screen = display.set_mode(output_size or (0, 0),
+                                               FULLSCREEN)
+            elif self.screen is None:
+                self.screen = display.set_mode(output_size or size)
+            self.canvas = Canvas(self.screen, dirty_rects, size)
+        if blit_audit:
+            self.canvas.audit = BlitAudit()  # Report cost of each sprite
+        self.fonts = GameFonts.shared()  # Shared by board and options
+        if self.canvas.scale:  # Render text at the output resolution
+            self.fonts.output_scale = min(self.canvas.scale)
+        # Load heavy assets in the background while options are shown
+        self.load_error = None
+        self.loader = Thread(target=self.load_assets, daemon=True)
+        self.loader.start()
         self.options = Options(self.key_select,  # In game user options
                                self.input_keys["Player1"]["left"],
                                self.input_keys["Player1"]["right"],
-                               self.key_exit)
-        self.options.prompt(self.screen)  # Prompt user for options
-        self.sounds = GameSounds()
+                               self.key_exit,
+                               self.fonts)
+        self.scene = OptionsScene(self)  # Prompt user for options
+
+    def start(self):
+        """Start a game once options are chosen and assets are loaded."""
+        self.loader.join()
+        if self.load_error:
+            raise self.load_error
+        self.board = Board(self.screen_width, self.screen_height,
+                           self.key_select,
+                           self.key_exit,
+                           self.fonts)
         self.turret = Turret(self.board.bunker_rect.midtop, self.screen_width)
+        print(f"Asset profile {GameImages.profile}: "
+              f"{GameImages.surface_bytes() // 1024} KiB of surfaces")
         self.bunker_destroyed = False
         self.demolition_stage = Demolition.NONE
         self.bullets = []
@@ -97,9 +169,6 @@ class Game:
         self.jets = sprite.Group()
         self.bombs = []
         self.reset()
-        self.render()
-        self.board.display_wave_number(1, 0, self.cocktail,
-                                       self.screen, display)
 
     def collision_detection(self):
         """Detect collisions between game objects."""
@@ -164,10 +233,12 @@ class Game:
         return False
 
     def demolish_bunker(self, x_coords):
-        """Animate the demolishing of the bunker.
+        """Choreograph the demolishing of the bunker.
 
         Args:
             x_coords([int]): List of paratrooper X coordinates
+        Returns:
+            Timeline: Demolition sequence, one pixel step per step
         """
         # Determine if attack is on the left side (True) or right side (False)
         right_x = self.zones.centers[self.zones.first_right]
@@ -179,42 +250,37 @@ class Game:
         y = self.board.ground_y
         targets = self.zones.get_demo_targets(side, y, CROUCHED_SIZE)
         paratroopers = self.paratroopers[self.current_player]
+        timeline = Timeline()
         # Move 3 paratroopers to form pyramid
         for i in range(3):
             paratrooper = next(p for p in paratroopers
                                if p.rect.centerx == x_coords[i])
             paratrooper.current_sprite_index = 0 if side == "left" else 2
-            gc.collect()
-            for _ in range(x_coords[i], targets[i][0] + x_dir, x_dir):
-                paratrooper.walk((x_dir, 0))
-                self.clock.tick(self.fps * 2)
-                self.render()
-                display.flip()
-            for _ in range(y, targets[i][1], -1):
-                paratrooper.walk((0, -1))
-                self.clock.tick(self.fps * 2)
-                self.render()
-                display.flip()
-            paratrooper.crouch()
+            timeline.tween(paratrooper, (x_dir, 0), len(
+                range(x_coords[i], targets[i][0] + x_dir, x_dir)))
+            timeline.tween(paratrooper, (0, -1), len(
+                range(y, targets[i][1], -1)))
+            timeline.cue(paratrooper.crouch)
         # Move final paratrooper to demolish position
         paratrooper = next(p for p in paratroopers
                            if p.rect.centerx == x_coords[3])
         paratrooper.current_sprite_index = 4  # Bomb carrier
-        gc.collect()
+        steps = 0
         for x in range(x_coords[3], targets[3][0] + x_dir, x_dir):
-            paratrooper.walk((x_dir, 0))
-            self.clock.tick(self.fps * 2)
-            self.render()
-            display.flip()
+            steps += 1
             if (x == targets[1][0] or x == targets[1][0] + 1 or
                     x == targets[2][0] or x == targets[2][0] + 1):
                 # Climb up
-                for _ in range(0, CROUCHED_SIZE[1]):
-                    paratrooper.walk((0, -1))
-                    self.clock.tick(self.fps * 2)
-                    self.render()
-                    display.flip()
-        paratrooper.crouch()
+                timeline.tween(paratrooper, (x_dir, 0), steps)
+                timeline.tween(paratrooper, (0, -1), CROUCHED_SIZE[1])
+                steps = 0
+        timeline.tween(paratrooper, (x_dir, 0), steps)
+        timeline.cue(paratrooper.crouch)
+        timeline.cue(self.bunker_demolished)
+        return timeline
+
+    def bunker_demolished(self):
+        """End the demolition by exploding the bunker."""
         self.demolition_stage = Demolition.NONE
         self.bunker_destroyed = True
         self.explode_bunker()
@@ -230,16 +296,14 @@ class Game:
             (0, -12)
         ))
 
-    def handle_input(self):
-        """Handle keyboard and mouse input."""
+    def handle_input(self, events):
+        """Handle keyboard and mouse input.
+
+        Args:
+            events([pygame.event.Event]): Events since the last frame
+        """
         mouse_x, mouse_y = None, None
-        for e in event.get():
-            if (e.type == QUIT or e.type == KEYDOWN and
-                    e.key == self.key_exit):
-                quit()
-                exit()
-            if e.type == END_SOUND_EVENT:
-                self.sounds.clean_up_channels()  # Clean up all unused channels
+        for e in events:
             if (self.bunker_destroyed or
                     self.demolition_stage == Demolition.ACTIVE):
                 return
@@ -253,7 +317,7 @@ class Game:
                         self.turret.animation_index += 1
                     self.bullets.append(
                         Bullet(self.turret.get_muzzle_pos(),
-                               self.turret.get_muzzle_vector()))
+                               self.turret.angle))
                     self.scores[self.current_player] = max(
                         0, self.scores[self.current_player] - BULLET_PENALTY)
 
@@ -266,7 +330,8 @@ class Game:
                 mouse_x, mouse_y = e.rel  # Relative mouse movement
 
         if not self.mouse_rel:
-            mouse_x, mouse_y = mouse.get_pos()  # Actual mouse position
+            # Actual mouse position
+            mouse_x, mouse_y = self.canvas.logical(mouse.get_pos())
 
         if (self.current_player == 0 and mouse_x and
                 self.turret.mouse != mouse_x):
@@ -275,6 +340,27 @@ class Game:
               self.turret.mouse != mouse_y):
             self.turret.move(mouse_y, self.mouse_rel)
 
+    def load_assets(self):
+        """Load sounds, sprite sheets and collision masks.
+
+        Runs on a worker thread while the options screen is displayed.
+        """
+        try:
+            self.bundle = AssetBundle.open()  # Pre-decoded assets if built
+            if self.bundle and GameImages.profile == STANDARD:
+                self.bundle.install_images()  # Bundled pixels are 32-bit
+            GameImages.build_atlas()  # Pack sprite sheets into texture atlas
+            if self.canvas.scale:  # Resize atlas once for the output
+                GameImages.scale_atlas(self.canvas.scale)
+            if self.cocktail:  # Flip atlas once for player 2
+                GameImages.flip_atlas()
+            self.sounds = GameSounds.shared(bundle=self.bundle)
+            for sprite_class in (Bomb, Bullet, Explosion, Helicopter, Jet,
+                                 Paratrooper):
+                sprite_class.preload()
+        except Exception as error:  # Re-raised on the main thread
+            self.load_error = error
+
     def regulate_aircraft(self):
         """Generate helicopters and jets."""
         if self.waves[self.current_player].sorties <= 0:
@@ -283,10 +369,10 @@ class Game:
             return
         # Pause minimum 1 second between aircrafts
         self.frames_since_last_aircraft += 1
-        if self.frames_since_last_aircraft < self.fps:
+        if self.frames_since_last_aircraft < STEP_RATE:
             return
         # Average number of frames between activations
-        avg_frames = self.fps * self.waves[self.current_player].average_delay
+        avg_frames = STEP_RATE * self.waves[self.current_player].average_delay
         # Check if the random event should be activated
         if randint(0, int(avg_frames) - 1) == 0:
             add_chopper = True if (
@@ -326,32 +412,39 @@ class Game:
                 else:
                     self.sounds.loop("jet_rl", "play", False)
 
-    def render(self):
-        """Render game elements."""
-        self.screen.fill("skyblue4")  # Background color
-        self.board.draw(self.screen)  # Game board
-        self.board.draw_score(self.scores, self.lives, self.screen,
+    def render(self, alpha=1.0):
+        """Render game elements.
+
+        Args:
+            alpha(float): Fraction of the last simulation step to show
+        """
+        # Cocktail mode draws player 2's turn upside down
+        self.canvas.mirrored = self.cocktail and self.current_player == 1
+        self.canvas.begin(self.board.background)  # Sky, ground & bunker
+        self.board.draw_score(self.scores, self.lives, self.canvas,
                               self.current_player)
-        for bomb in self.bombs:
-            bomb.draw(self.screen)
-        for bullet in self.bullets:
-            bullet.draw(self.screen)
+        self.canvas.layer = Layer.PROJECTILES
+        self.canvas.blit_sprites(self.bombs, alpha)
+        self.canvas.blit_sprites(self.bullets, alpha)
+        self.canvas.layer = Layer.EXPLOSIONS
         for explosion in self.explosions:
-            explosion.draw(self.screen)
-        for paratrooper in self.paratroopers[self.current_player]:
-            paratrooper.draw(self.screen)
+            explosion.draw(self.canvas, alpha)
+        self.canvas.layer = Layer.PARATROOPERS
+        paratroopers = self.paratroopers[self.current_player]
+        self.canvas.blit_sprites([paratrooper.chute
+                                  for paratrooper in paratroopers
+                                  if paratrooper.under_canopy], alpha)
+        self.canvas.blit_sprites(paratroopers, alpha)
+        self.canvas.layer = Layer.TURRET
         if not self.bunker_destroyed:
-            self.turret.draw(self.screen)
-        self.helicopters.draw(self.screen)
-        self.jets.draw(self.screen)
+            self.turret.draw(self.canvas)
+        self.canvas.layer = Layer.AIRCRAFT
+        self.canvas.blit_sprites(self.helicopters, alpha)
+        self.canvas.blit_sprites(self.jets, alpha)
+        self.canvas.layer = Layer.OVERLAY  # FPS and banners
         # Display optional FPS
         if self.show_fps:
-            self.board.draw_fps(self.screen, self.clock)
-        # Check for cocktail mode
-        if self.cocktail and self.current_player == 1:
-            # Rotate the entire display by 180 degrees
-            rotated_screen = transform.rotate(self.screen, 180)
-            self.screen.blit(rotated_screen, (0, 0))
+            self.board.draw_fps(self.canvas, self.clock)
 
     def reset(self):
         """Reset game."""
@@ -377,16 +470,56 @@ class Game:
             self.zones.clear_all_zones(player_id=i)
         self.current_player = 0
 
+    def next_turn(self, delay=2500):
+        """Switch players and show the wave banner.
+
+        Args:
+            delay(int): Time to show the banner (milliseconds)
+        Returns:
+            Scene: Wave banner scene
+        """
+        self.toggle_players()
+        self.frames_since_last_aircraft = 255  # No delay at wave start
+        gc.collect()
+        return WaveBannerScene(self, delay)
+
     def run(self):
         """Run game."""
         while True:
-            self.clock.tick(self.fps)
-            self.regulate_aircraft()
-            self.handle_input()
-            self.update()
-            self.render()
-            display.flip()
-            self.collision_detection()
+            self.step(self.governor.wait(self.scene))
+
+    def step(self, events):
+        """Update and draw one frame of the current scene.
+
+        Args:
+            events([pygame.event.Event]): Events since the last frame
+        """
+        for e in events:
+            if (e.type == QUIT or e.type == KEYDOWN and
+                    e.key == self.key_exit):
+                quit()
+                exit()
+            if e.type == END_SOUND_EVENT:
+                self.sounds.clean_up_channels()  # Clean up all unused channels
+        scene = self.scene.update(events)
+        if scene is not None:
+            self.scene = scene
+        if self.governor.should_draw(self.scene):
+            if self.governor.exposed:
+                self.canvas.invalidate()  # Repaint the whole window
+                self.governor.exposed = False
+            self.scene.draw(self.canvas)
+            self.canvas.present()
+            self.scene.changed = False
+
+    def save_positions(self):
+        """Save the rect of every moving sprite before a simulation step."""
+        for sprites in (self.bombs, self.bullets, self.helicopters, self.jets,
+                        self.paratroopers[self.current_player]):
+            for moving_sprite in sprites:
+                moving_sprite.save_position()
+        for explosion in self.explosions:
+            explosion.save_position()
 
     def screen_complete(self):
         """Return True if screen clear of moving objects."""
@@ -412,7 +545,11 @@ class Game:
             self.current_player = 0
 
     def update(self):
-        """Update turret, bullets, enemies."""
+        """Update turret, bullets, enemies.
+
+        Returns:
+            Scene: Scene to switch to, or None to keep playing
+        """
         # Check for next wave
         if (self.waves[self.current_player].sorties <= 0
                 and self.screen_complete()):
@@ -420,13 +557,7 @@ class Game:
             # Switch players if 2 player game and bunker okay
             if (not self.bunker_destroyed and
                     self.demolition_stage == Demolition.NONE):
-                self.toggle_players()
-                self.render()
-                self.board.display_wave_number(
-                    self.waves[self.current_player].wave_number,
-                    self.current_player, self.cocktail, self.screen, display)
-                self.frames_since_last_aircraft = 255  # No delay at wave start
-                gc.collect()
+                return self.next_turn()
         # Check for destroyed bunker
         if self.bunker_destroyed and self.screen_complete():
             self.bunker_destroyed = False
@@ -436,21 +567,9 @@ class Game:
             self.turret.clear_animation()
             self.lives[self.current_player] -= 1
             if all(life < 0 for life in self.lives):
-                self.board.game_over(
-                    self.waves[self.current_player].wave_number,
-                    self.screen, display)
-                self.reset()
-                self.render()
-            self.toggle_players()
-            self.render()
+                return GameOverScene(self)
             # Display wave number and get ready
-            self.board.display_wave_number(
-                self.waves[self.current_player].wave_number,
-                self.current_player, self.cocktail,
-                self.screen, display, delay=3500)
-            event.clear()  # Clear any keyboard events pressed during explosion
-            self.frames_since_last_aircraft = 255  # No delay at wave start
-            gc.collect()
+            return self.next_turn(delay=3500)
         # Check for pending demoltion
         if (self.demolition_stage == Demolition.PENDING and
                 self.screen_complete()):
@@ -462,9 +581,10 @@ class Game:
             else:
                 # Begin demoltion
                 self.demolition_stage = Demolition.ACTIVE
-                self.demolish_bunker(team_x)
-                return
+                return DemolitionScene(self, team_x)
 
+        if not self.bunker_destroyed:
+            self.turret.update()  # Firing animation
         for bomb in self.bombs:
             if bomb.rect.bottom >= self.board.bunker_rect.top:
                 self.bombs.remove(bomb)
@@ -562,6 +682,7 @@ class Game:
                         and not self.bunker_destroyed):
                     # Bunker destroyed by 4 paratroopers landing on a side
                     self.demolition_stage = Demolition.PENDING
+        return None
 
 
 if __name__ == "__main__":
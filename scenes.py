@@ -0,0 +1,201 @@
+"""Sabotage game scenes.
+
+The game is always in exactly one scene.  Each frame the main loop passes
+the scene the events since the last frame, lets it update and then draw.
+A scene changes the game's state by returning the next scene from update,
+so nothing ever blocks the loop waiting on a timer, a key or a sound.
+Scenes that do not animate are only drawn when they change.
+"""
+from pygame import time
+from pygame.locals import KEYUP
+
+
+class Scene:
+    """Base game scene."""
+
+    animating = False  # True to draw every frame
+
+    def __init__(self, game):
+        """Scene constructor.
+
+        Args:
+            game(Game): Game the scene belongs to
+        """
+        self.game = game
+        self.changed = True  # Static scene needs drawing
+
+    def timeout(self):
+        """Return milliseconds until the scene changes by itself.
+
+        Returns:
+            int: Milliseconds, or None if only input changes the scene
+        """
+        return None
+
+    def update(self, events):
+        """Update the scene.
+
+        Args:
+            events([pygame.event.Event]): Events since the last frame
+        Returns:
+            Scene: Next scene, or None to stay in this scene
+        """
+        return None
+
+    def draw(self, canvas):
+        """Draw the scene.
+
+        Args:
+            canvas(Canvas): Game canvas
+        """
+
+
+class OptionsScene(Scene):
+    """Title screen prompting for the number of players."""
+
+    def __init__(self, game):
+        """Options scene constructor.
+
+        Args:
+            game(Game): Game the scene belongs to
+        """
+        super().__init__(game)
+        self.selected = False
+
+    def update(self, events):
+        """Start the game once selected and assets are loaded.
+
+        Assets load on a worker thread while the options are shown.
+        """
+        options = self.game.options
+        if not self.selected:
+            players = options.players
+            self.selected = options.handle(events)
+            if options.players != players:
+                self.changed = True
+        if self.selected and not self.game.loader.is_alive():
+            self.game.start()
+            return WaveBannerScene(self.game)
+        return None
+
+    def draw(self, canvas):
+        """Draw the options screen."""
+        self.game.options.draw(canvas)
+
+
+class WaveBannerScene(Scene):
+    """Frozen game frame with the wave number and player to get ready."""
+
+    def __init__(self, game, delay=2500):
+        """Wave banner scene constructor.
+
+        Args:
+            game(Game): Game the scene belongs to
+            delay(int): Time to show the banner (milliseconds)
+        """
+        super().__init__(game)
+        self.delay = delay
+        self.start = time.get_ticks()
+
+    def timeout(self):
+        """Return milliseconds until play resumes."""
+        return self.delay - (time.get_ticks() - self.start)
+
+    def update(self, events):
+        """Resume play once the banner has been shown long enough.
+
+        Input during the banner is discarded.
+        """
+        if time.get_ticks() - self.start > self.delay:
+            return PlayingScene(self.game)
+        return None
+
+    def draw(self, canvas):
+        """Draw the frozen frame and banner."""
+        game = self.game
+        wave_number = game.waves[game.current_player].wave_number
+        game.render()
+        game.board.draw_wave_number(wave_number, game.current_player, canvas)
+
+
+class PlayingScene(Scene):
+    """Active play."""
+
+    animating = True
+
+    def __init__(self, game):
+        """Playing scene constructor.
+
+        Args:
+            game(Game): Game the scene belongs to
+        """
+        super().__init__(game)
+        game.timestep.reset()
+
+    def update(self, events):
+        """Advance the game by the simulation steps due this frame."""
+        game = self.game
+        game.handle_input(events)
+        for _ in range(game.timestep.steps()):
+            game.save_positions()
+            game.collision_detection()
+            game.regulate_aircraft()
+            scene = game.update()
+            if scene is not None:
+                return scene
+        return None
+
+    def draw(self, canvas):
+        """Draw the game between the last two simulation steps."""
+        self.game.render(self.game.timestep.alpha)
+
+
+class DemolitionScene(Scene):
+    """Paratroopers forming a pyramid to demolish the bunker."""
+
+    animating = True
+    STEPS_PER_STEP = 2  # Paratroopers move at twice the simulation rate
+
+    def __init__(self, game, x_coords):
+        """Demolition scene constructor.
+
+        Args:
+            game(Game): Game the scene belongs to
+            x_coords([int]): List of paratrooper X coordinates
+        """
+        super().__init__(game)
+        self.timeline = game.demolish_bunker(x_coords)
+
+    def update(self, events):
+        """Move the paratroopers, resuming play once the bunker is gone."""
+        game = self.game
+        for _ in range(game.timestep.steps()):
+            game.save_positions()
+            if not self.timeline.advance(self.STEPS_PER_STEP):
+                return PlayingScene(game)
+        return None
+
+    def draw(self, canvas):
+        """Draw the game between the last two simulation steps."""
+        self.game.render(self.game.timestep.alpha)
+
+
+class GameOverScene(Scene):
+    """Game over, waiting for the select key to resume."""
+
+    def update(self, events):
+        """Resume at the last wave once the select key is released."""
+        game = self.game
+        for e in events:
+            if e.type == KEYUP and e.key == game.key_select:
+                game.reset()
+                return game.next_turn(delay=3500)
+        return None
+
+    def draw(self, canvas):
+        """Draw the final frame and game over banner."""
+        game = self.game
+        wave_number = game.waves[game.current_player].wave_number
+        game.render()
+        canvas.mirrored = False  # Game over faces player 1
+        game.board.draw_game_over(wave_number, canvas)
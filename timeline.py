@@ -0,0 +1,95 @@
+"""Keyframed timelines for scripted sequences.
+
+A timeline is a list of keyframes played in order.  A keyframe repeats an
+action for a number of steps; a cue is a keyframe of no steps that runs its
+action once, before the next step.  The main loop advances a timeline a few
+steps per frame, so a scripted sequence costs no more than a normal frame.
+It can also be fast-forwarded or skipped to the end without drawing.
+"""
+from collections import deque
+
+
+class Keyframe:
+    """Action repeated on each step of a keyframe."""
+
+    def __init__(self, steps, action, *args):
+        """Keyframe constructor.
+
+        Args:
+            steps(int): Number of steps (0 to run the action once)
+            action(callable): Called on each step
+            args: Arguments passed to action
+        """
+        self.steps = steps
+        self.action = action
+        self.args = args
+
+
+class Timeline:
+    """Keyframes played one step at a time."""
+
+    def __init__(self):
+        """Timeline constructor."""
+        self.keyframes = deque()
+
+    def tween(self, actor, offset, steps):
+        """Add a keyframe walking an actor by an offset each step.
+
+        Args:
+            actor(pygame.sprite.Sprite): Sprite with a walk method
+            offset((int, int)): X and Y movement per step
+            steps(int): Number of steps
+        """
+        if steps > 0:
+            self.keyframes.append(Keyframe(steps, actor.walk, offset))
+
+    def cue(self, action, *args):
+        """Add an action to run once, before the next step.
+
+        Args:
+            action(callable): Action to run
+            args: Arguments passed to action
+        """
+        self.keyframes.append(Keyframe(0, action, *args))
+
+    @property
+    def done(self):
+        """Return True once every keyframe has been played."""
+        return not self.keyframes
+
+    def step(self):
+        """Play one step.
+
+        Returns:
+            bool: False once the timeline has ended
+        """
+        keyframes = self.keyframes
+        while keyframes and keyframes[0].steps == 0:  # Cues due
+            keyframe = keyframes.popleft()
+            keyframe.action(*keyframe.args)
+        if not keyframes:
+            return False
+        keyframe = keyframes[0]
+        keyframe.action(*keyframe.args)
+        keyframe.steps -= 1
+        if keyframe.steps == 0:
+            keyframes.popleft()
+        return True
+
+    def advance(self, steps):
+        """Fast-forward a number of steps.
+
+        Args:
+            steps(int): Steps to play
+        Returns:
+            bool: False once the timeline has ended
+        """
+        for _ in range(steps):
+            if not self.step():
+                return False
+        return True
+
+    def skip(self):
+        """Play the rest of the timeline at once."""
+        while self.step():
+            pass
@@ -0,0 +1,47 @@
+"""Fixed simulation timestep."""
+from time import perf_counter
+
+STEP_RATE = 60  # Simulation steps per second
+MAX_STEPS = 10  # Most steps run in one frame to catch up
+
+
+class FixedStep:
+    """Turns elapsed frame time into whole simulation steps.
+
+    The game advances in steps of 1 / STEP_RATE seconds whatever the frame
+    rate, so speeds, gravity and difficulty do not depend on it.  Time left
+    over after the last whole step is kept for the next frame, and its
+    fraction of a step (alpha) is how far to interpolate moving sprites
+    from their previous positions when drawing.
+    """
+
+    def __init__(self, rate=STEP_RATE):
+        """Fixed timestep constructor.
+
+        Args:
+            rate(int): Simulation steps per second
+        """
+        self.step_time = 1 / rate
+        self.accumulator = 0.0  # Seconds not yet simulated
+        self.last = None  # Time of the last frame
+        self.alpha = 1.0  # Fraction of a step left in the accumulator
+
+    def reset(self):
+        """Start timing afresh, e.g. after a pause between scenes."""
+        self.last = None
+
+    def steps(self):
+        """Return the number of steps due since the last frame."""
+        now = perf_counter()
+        if self.last is None:  # First frame runs a single step
+            self.accumulator = self.step_time
+        else:
+            self.accumulator += now - self.last
+        self.last = now
+        steps = int(self.accumulator / self.step_time)
+        if steps > MAX_STEPS:  # Too far behind, drop the backlog
+            steps = MAX_STEPS
+            self.accumulator = steps * self.step_time
+        self.accumulator -= steps * self.step_time
+        self.alpha = self.accumulator / self.step_time
+        return steps
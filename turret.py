@@ -1,5 +1,6 @@
 """Turret."""
-from pygame import image, Rect, Vector2
+from game_images import GameImages
+from pygame import Rect, Vector2
 
 ANIMATION_DELAY = 4
 BULLET_SPEED = 10
@@ -52,15 +53,13 @@ class Turret:
         # Start at angle 0
         self.current_angle_index = POSITIONS.index(0)
 
-        # Load the sprites for each angle
+        # Load the sprite sheet (5 firing frames) for each angle
         self.sprites = {}
         for angle in POSITIONS:
-            self.sprites[angle] = [
-                image.load(f"{PATH}{angle if angle != 0 else f'0{angle}'}.png")
-                for _ in range(5)
-            ]
-        # Starting sprite is gun unfired at angle 0
-        self.current_sprite = self.sprites[0][0]
+            self.sprites[angle] = GameImages.load(
+                f"{PATH}{angle if angle != 0 else f'0{angle}'}.png")
+        # Starting sprite is gun at angle 0
+        self.current_sprite = self.sprites[0]
         self.animation_index = 0  # Index to track firing animation
         self.animation_count = 0
         # Initial mouse position
@@ -94,16 +93,6 @@ class Turret:
         # Set the midbottom position
         target_rect.midbottom = (self.x, self.y)
         screen.blit(self.current_sprite, target_rect, source_rect)
-
-        # Check if firing
-        if self.animation_index > 0:
-            self.animation_count += 1
-            if self.animation_count >= ANIMATION_DELAY:
-                self.animation_count = 0
-                self.animation_index += 1
-                if self.animation_index > 4:
-                    self.animation_index = 0
-                self.update_sprite()
         """
         # Draw project bullet trajectory
         draw.circle(screen, (255, 0, 0), self.get_muzzle_pos(), 5)
@@ -113,6 +102,11 @@ class Turret:
                   trajectory_end, 1)
         """
 
+    @property
+    def angle(self):
+        """Return current angle of turret in degrees (0=straight up)."""
+        return POSITIONS[self.current_angle_index]
+
     def get_muzzle_pos(self):
         """Get muzzle position."""
         return (self.bunker_midtop +
@@ -173,8 +167,18 @@ class Turret:
         self.animation_count = 0
         self.update_sprite()
 
+    def update(self):
+        """Advance the firing animation by one simulation step."""
+        if self.animation_index > 0:
+            self.animation_count += 1
+            if self.animation_count >= ANIMATION_DELAY:
+                self.animation_count = 0
+                self.animation_index += 1
+                if self.animation_index > 4:
+                    self.animation_index = 0
+                self.update_sprite()
+
     def update_sprite(self):
         """Update sprite."""
         self.current_sprite = self.sprites[
-            POSITIONS[self.current_angle_index]
-            ][self.animation_index]
+            POSITIONS[self.current_angle_index]]